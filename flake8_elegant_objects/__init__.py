@@ -8,7 +8,7 @@ Based on Yegor Bugayenko's principles from elegantobjects.org
 
 import ast
 from collections.abc import Iterator
-from typing import Any
+from typing import Any, ClassVar
 
 from .base import ElegantObjectsCore
 
@@ -16,8 +16,10 @@ from .base import ElegantObjectsCore
 class ElegantObjectsPlugin:
     """Flake8 plugin to check for Elegant Objects violations."""
 
-    name = "flake8-elegant-objects"
-    version = "1.0.0"
+    __slots__ = ("_core", "tree")
+
+    name: ClassVar[str] = "flake8-elegant-objects"
+    version: ClassVar[str] = "1.0.0"
 
     def __init__(self, tree: ast.AST) -> None:
         self.tree = tree
@@ -25,9 +27,9 @@ class ElegantObjectsPlugin:
 
     def run(self) -> Iterator[tuple[int, int, str, type["ElegantObjectsPlugin"]]]:
         """Run the checker and yield errors."""
-        violations = self._core.check_violations()
-        for violation in violations:
-            yield (violation.line, violation.column, violation.message, type(self))
+        plugin = type(self)
+        for line, column, message in self._core.iter_violations():
+            yield (line, column, message, plugin)
 
 
 # Entry point for flake8 plugin registration
@@ -2,9 +2,72 @@
 
 import argparse
 import ast
+from concurrent.futures import ProcessPoolExecutor
+from importlib.util import decode_source
+import os
 import sys
 
-from .base import ElegantObjectsCore
+from . import _cache
+from .base import ElegantObjectsCore, principle_dispatch, skipped_leaves
+
+
+def _is_blank(data: bytes) -> bool:
+    """Check if source holds nothing but whitespace and comments."""
+    for line in data.splitlines():
+        stripped = line.lstrip()
+        if stripped and not stripped.startswith(b"#"):
+            return False
+    return True
+
+
+def _lint_file(
+    file_path: str, show_source: bool, cache_dir: str | None
+) -> tuple[list[str], str, int]:
+    """Check one file and return its report lines, error message and count."""
+    output: list[str] = []
+
+    try:
+        # Unbuffered: readall sizes one buffer from fstat, no extra copy layer
+        with open(file_path, "rb", buffering=0) as f:
+            data = f.readall()
+
+        # Empty and comment-only modules cannot violate anything: skip parsing.
+        # Anything else is parsed, so syntax errors are still reported
+        if _is_blank(data):
+            return [f"{file_path}: No violations found ✓"], "", 0
+
+        cache_path = _cache.path_for(cache_dir, data) if cache_dir else None
+        violations = _cache.load(cache_path) if cache_path else None
+        if violations is None:
+            # Parsing bytes lets the compiler decode once, honouring coding cookies
+            tree = ast.parse(data, filename=file_path)
+            core = ElegantObjectsCore(tree)
+            violations = list(core.iter_violations())
+            if cache_path:
+                _cache.store(cache_path, violations)
+
+        file_errors = 0
+        # Only source context needs the decoded text; decode as the parser did,
+        # honouring coding cookies and BOMs
+        lines = decode_source(data).split("\n") if show_source else []
+
+        for line, column, message in violations:
+            output.append(f"{file_path}:{line}:{column}: {message}")
+
+            if show_source:
+                if 0 <= line - 1 < len(lines):
+                    output.append(f"    {lines[line - 1].strip()}")
+                output.append("")
+
+            file_errors += 1
+
+        if file_errors == 0:
+            output.append(f"{file_path}: No violations found ✓")
+
+    except Exception as e:
+        return output, f"Error processing {file_path}: {e}", 0
+
+    return output, "", file_errors
 
 
 def main() -> None:
@@ -18,44 +81,50 @@ def main() -> None:
         action="store_true",
         help="Show source code context for violations",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write cached results",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=_cache.default_dir(),
+        help="Directory for cached results (default: %(default)s)",
+    )
 
     args = parser.parse_args()
 
+    files = [path for path in args.files if path.endswith(".py")]
+    show_source = [args.show_source] * len(files)
+    cache_dir = [None if args.no_cache else args.cache_dir] * len(files)
     total_errors = 0
 
-    for file_path in args.files:
-        if not file_path.endswith(".py"):
-            continue
-
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                source = f.read()
-
-            tree = ast.parse(source, filename=file_path)
-            core = ElegantObjectsCore(tree)
-
-            file_errors = 0
-            violations = core.check_violations()
-
-            for violation in violations:
-                print(
-                    f"{file_path}:{violation.line}:{violation.column}: {violation.message}"
-                )
-
-                if args.show_source:
-                    lines = source.split("\n")
-                    if 0 <= violation.line - 1 < len(lines):
-                        print(f"    {lines[violation.line - 1].strip()}")
-                    print()
-
-                file_errors += 1
-                total_errors += 1
-
-            if file_errors == 0:
-                print(f"{file_path}: No violations found ✓")
-
-        except Exception as e:
-            print(f"Error processing {file_path}: {e}", file=sys.stderr)
+    # Files are independent and CPU-bound, so spread them across processes;
+    # a single file is not worth the pool startup
+    if len(files) > 1:
+        workers = min(len(files), os.cpu_count() or 1)
+        # Several chunks per worker amortise IPC yet keep every worker busy
+        chunksize = max(1, len(files) // (workers * 4))
+        # Build the shared principle tables and cache key before the pool
+        # starts, so forked workers inherit them instead of each rebuilding them
+        principle_dispatch()
+        principle_dispatch(in_class=True)
+        skipped_leaves()
+        if cache_dir[0]:
+            _cache.code_digest()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(
+                pool.map(_lint_file, files, show_source, cache_dir, chunksize=chunksize)
+            )
+    else:
+        results = list(map(_lint_file, files, show_source, cache_dir))
+
+    for output, error, file_errors in results:
+        for line in output:
+            print(line)
+        if error:
+            print(error, file=sys.stderr)
+        total_errors += file_errors
 
     if total_errors > 0:
         print(f"\nTotal violations found: {total_errors}")
@@ -0,0 +1,85 @@
+"""On-disk cache of lint results keyed by source contents."""
+
+from functools import cache
+import hashlib
+from importlib.machinery import EXTENSION_SUFFIXES, SOURCE_SUFFIXES
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+
+CachedViolations = list[tuple[int, int, str]]
+
+_CODE_SUFFIXES = (*SOURCE_SUFFIXES, *EXTENSION_SUFFIXES)
+
+# AST shapes differ between interpreters and their versions, so results are
+# kept apart, e.g. "cpython-312"
+_PYTHON_TAG = (
+    sys.implementation.cache_tag
+    or f"{sys.implementation.name}-{sys.version_info[0]}{sys.version_info[1]}"
+)
+
+
+def default_dir() -> str:
+    """Return the per-user cache directory for lint results."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "flake8-elegant-objects")
+
+
+@cache
+def code_digest() -> str:
+    """Return a digest of the plugin's own modules, computed once per process."""
+    # Any edit to a check changes its results, while the version string only
+    # changes on release, so entries are keyed by the code itself
+    files = sorted(
+        path
+        for path in Path(__file__).parent.iterdir()
+        if path.name.endswith(_CODE_SUFFIXES)
+    )
+    # A mypyc build keeps the compiled code in one shared top-level module
+    for name, module in sorted(sys.modules.items()):
+        location = getattr(module, "__file__", None)
+        if name.endswith("__mypyc") and location:
+            files.append(Path(location))
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def path_for(cache_dir: str, data: bytes) -> Path:
+    """Return the cache file for source bytes under this plugin code and Python."""
+    digest = hashlib.sha256(data).hexdigest()
+    return (
+        Path(cache_dir)
+        / _PYTHON_TAG
+        / code_digest()
+        / digest[:2]
+        / f"{digest[2:]}.json"
+    )
+
+
+def load(path: Path) -> CachedViolations | None:
+    """Return cached violations, or None on a miss or unreadable entry."""
+    try:
+        with path.open(encoding="utf-8") as f:
+            return [(line, column, message) for line, column, message in json.load(f)]
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def store(path: Path, violations: CachedViolations) -> None:
+    """Store violations, ignoring failures: the cache is only an accelerator."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent workers never read a partial entry
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(violations, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
@@ -1,73 +1,257 @@
 """Base classes and protocols for Elegant Objects checkers."""
 
 import ast
-from typing import Protocol
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from functools import cache
+from typing import ClassVar, NamedTuple, Protocol, TypeVar, cast
+
+# AST node classes are never subclassed, so checks throughout compare exact
+# types with `type(node) is ...` rather than calling isinstance
+
+# Tuple rather than a `X | Y` union: the union is rebuilt on every evaluation
+FUNCTION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+# Nodes without child nodes worth visiting: contexts, operators and name-only
+# statements; pruned at push time unless some principle reports on them
+_LEAF_TYPES = frozenset(
+    cls
+    for cls in vars(ast).values()
+    if isinstance(cls, type)
+    and issubclass(
+        cls, (ast.expr_context, ast.operator, ast.unaryop, ast.cmpop, ast.boolop)
+    )
+) | {
+    ast.Name,
+    ast.alias,
+    ast.Pass,
+    ast.Break,
+    ast.Continue,
+    ast.Global,
+    ast.Nonlocal,
+    ast.Import,
+    ast.ImportFrom,
+}
+
+# Fields that only ever hold identifiers, flags or numbers, never child nodes
+_SCALAR_FIELDS = frozenset(
+    {
+        "arg",
+        "asname",
+        "attr",
+        "conversion",
+        "id",
+        "is_async",
+        "kind",
+        "level",
+        "module",
+        "simple",
+        "type_comment",
+    }
+)
+
+# Node types whose "name" is an identifier; on others, such as the 3.12+
+# ast.TypeAlias, it holds a child node
+_IDENTIFIER_NAMED = frozenset(
+    getattr(ast, type_name)
+    for type_name in (
+        "FunctionDef",
+        "AsyncFunctionDef",
+        "ClassDef",
+        "ExceptHandler",
+        "alias",
+        "MatchAs",
+        "MatchStar",
+        "TypeVar",
+        "ParamSpec",
+        "TypeVarTuple",
+    )
+    if hasattr(ast, type_name)
+)
+
+# Node type -> fields that may hold child nodes, classified once at import so
+# traversal reads just those instead of probing every field per node
+_CHILD_FIELDS: dict[type[ast.AST], tuple[str, ...]] = {
+    cls: tuple(
+        field
+        for field in cls._fields
+        if field not in _SCALAR_FIELDS
+        and not (field == "name" and cls in _IDENTIFIER_NAMED)
+    )
+    for cls in vars(ast).values()
+    if isinstance(cls, type) and issubclass(cls, ast.AST)
+}
+
+_NO_DECORATORS: frozenset[str] = frozenset()
+
+
+def named(template: str, name: str) -> str:
+    """Fill the '{name}' placeholder of an ErrorCodes template."""
+    # One C-level replace is several times cheaper than str.format(name=...)
+    return template.replace("{name}", name)
 
 
 class ErrorCodes:
     """Centralized error message definitions."""
 
     # Naming violations (EO001-EO004)
-    EO001 = "EO001 Class name '{name}' violates -er principle (describes what it does, not what it is)"
-    EO002 = (
+    EO001: ClassVar[str] = (
+        "EO001 Class name '{name}' violates -er principle (describes what it does, not what it is)"
+    )
+    EO002: ClassVar[str] = (
         "EO002 Method name '{name}' violates -er principle (should be noun, not verb)"
     )
-    EO003 = (
+    EO003: ClassVar[str] = (
         "EO003 Variable name '{name}' violates -er principle (should be noun, not verb)"
     )
-    EO004 = (
+    EO004: ClassVar[str] = (
         "EO004 Function name '{name}' violates -er principle (should be noun, not verb)"
     )
-    EO005 = "EO005 Null (None) usage violates EO principle (avoid None)"
-    EO006 = "EO006 Code in constructor violates EO principle (constructors should only assign parameters)"
-    EO007 = "EO007 Getter/setter method '{name}' violates EO principle (avoid getters/setters)"
-    EO008 = "EO008 Mutable object violation: '{name}' should be immutable"
-    EO009 = (
+    EO005: ClassVar[str] = "EO005 Null (None) usage violates EO principle (avoid None)"
+    EO006: ClassVar[str] = (
+        "EO006 Code in constructor violates EO principle (constructors should only assign parameters)"
+    )
+    EO007: ClassVar[str] = (
+        "EO007 Getter/setter method '{name}' violates EO principle (avoid getters/setters)"
+    )
+    EO008: ClassVar[str] = (
+        "EO008 Mutable object violation: '{name}' should be immutable"
+    )
+    EO009: ClassVar[str] = (
         "EO009 Static method '{name}' violates EO principle (no static methods allowed)"
     )
-    EO010 = "EO010 isinstance/type casting violates EO principle (avoid type discrimination)"
-    EO011 = "EO011 Public method '{name}' without contract (Protocol/ABC) violates EO principle"
-    EO012 = "EO012 Test method '{name}' contains non-assertThat statements (only assertThat allowed)"
-    EO013 = "EO013 ORM/ActiveRecord pattern '{name}' violates EO principle"
-    EO014 = "EO014 Implementation inheritance violates EO principle (class '{name}' inherits from non-abstract class)"
+    EO010: ClassVar[str] = (
+        "EO010 isinstance/type casting violates EO principle (avoid type discrimination)"
+    )
+    EO011: ClassVar[str] = (
+        "EO011 Public method '{name}' without contract (Protocol/ABC) violates EO principle"
+    )
+    EO012: ClassVar[str] = (
+        "EO012 Test method '{name}' contains non-assertThat statements (only assertThat allowed)"
+    )
+    EO013: ClassVar[str] = (
+        "EO013 ORM/ActiveRecord pattern '{name}' violates EO principle"
+    )
+    EO014: ClassVar[str] = (
+        "EO014 Implementation inheritance violates EO principle (class '{name}' inherits from non-abstract class)"
+    )
 
 
-class Violation:
+class Violation(NamedTuple):
     """Represents a detected violation."""
 
-    def __init__(self, line: int, column: int, message: str) -> None:
-        self._line = line
-        self._column = column
-        self._message = message
+    # A plain tuple: reported without per-field property calls
+    line: int
+    column: int
+    message: str
 
-    @property
-    def line(self) -> int:
-        return self._line
 
-    @property
-    def column(self) -> int:
-        return self._column
+# Checks return the shared empty tuple when nothing is found, no list per call
+Violations = Sequence[Violation]
 
-    @property
-    def message(self) -> str:
-        return self._message
 
+_NodeT = TypeVar("_NodeT", bound=ast.AST)
+
+
+class TreeIndex:
+    """Whole-tree indexes for one run, built lazily and shared by its checks."""
+
+    # Owned by a single run rather than by the shared principles, so principles
+    # hold no state and no tree outlives the run that checked it
+    __slots__ = (
+        "_annotation_ids",
+        "_by_type",
+        "_class_defs",
+        "class_contracts",
+        "contract_names",
+        "tree",
+    )
 
-Violations = list[Violation]
+    def __init__(self, tree: ast.AST) -> None:
+        self.tree = tree
+        self._by_type: dict[type[ast.AST], list[ast.AST]] | None = None
+        self._annotation_ids: frozenset[int] | None = None
+        self._class_defs: dict[str, ast.ClassDef] | None = None
+        # Class node id -> whether the class implements a Protocol/ABC
+        self.class_contracts: dict[int, bool] = {}
+        # Base name -> whether it resolves to a Protocol/ABC in this tree
+        self.contract_names: dict[str, bool] = {}
+
+    def nodes_of(self, node_type: type[_NodeT]) -> Sequence[_NodeT]:
+        """Return the nodes of exactly node_type in the tree, in ast.walk order."""
+        by_type = self._by_type
+        if by_type is None:
+            # One walk partitions the tree for every index built from it
+            by_type = self._by_type = {}
+            for node in walk(self.tree):
+                bucket = by_type.get(type(node))
+                if bucket is None:
+                    by_type[type(node)] = [node]
+                else:
+                    bucket.append(node)
+        return cast("Sequence[_NodeT]", by_type.get(node_type, ()))
+
+    def annotation_ids(self) -> frozenset[int]:
+        """Return ids of all nodes inside type annotations of the tree."""
+        if self._annotation_ids is None:
+            annotations: list[ast.expr] = []
+            # Function return annotations
+            functions: list[ast.FunctionDef | ast.AsyncFunctionDef] = [
+                *self.nodes_of(ast.FunctionDef)
+            ]
+            functions.extend(self.nodes_of(ast.AsyncFunctionDef))
+            for function in functions:
+                if function.returns:
+                    annotations.append(function.returns)
+            # Parameter annotations
+            for arg in self.nodes_of(ast.arg):
+                if arg.annotation:
+                    annotations.append(arg.annotation)
+            # Variable annotations
+            for assignment in self.nodes_of(ast.AnnAssign):
+                if assignment.annotation:
+                    annotations.append(assignment.annotation)
+            self._annotation_ids = frozenset(
+                id(child) for annotation in annotations for child in walk(annotation)
+            )
+        return self._annotation_ids
+
+    def class_defs(self) -> dict[str, ast.ClassDef]:
+        """Return class definitions by name; the first in walk order wins."""
+        if self._class_defs is None:
+            class_defs: dict[str, ast.ClassDef] = {}
+            for node in self.nodes_of(ast.ClassDef):
+                class_defs.setdefault(node.name, node)
+            self._class_defs = class_defs
+        return self._class_defs
 
 
 class Source:
     """Aggregation of AST node and current class context."""
 
+    # One instance per dispatched node: no per-instance __dict__
+    __slots__ = (
+        "_current_class",
+        "_decorator_names",
+        "_index",
+        "_is_method",
+        "_node",
+        "_tree",
+    )
+
     def __init__(
         self,
         node: ast.AST,
         current_class: ast.ClassDef | None = None,
         tree: ast.AST | None = None,
+        index: TreeIndex | None = None,
     ) -> None:
         self._node = node
         self._current_class = current_class
         self._tree = tree
+        self._index = index
+        self._is_method: bool | None = None
+        self._decorator_names: frozenset[str] | None = None
 
     @property
     def node(self) -> ast.AST:
@@ -81,20 +265,78 @@ class Source:
     def tree(self) -> ast.AST | None:
         return self._tree
 
+    @property
+    def index(self) -> TreeIndex | None:
+        """Whole-tree indexes of the run, or None when there is no tree."""
+        if self._index is None and self._tree is not None:
+            # Standalone sources get their own index; runs share one
+            self._index = TreeIndex(self._tree)
+        return self._index
+
+    @property
+    def is_method(self) -> bool:
+        """Check once per node if it is a method, shared by all principles."""
+        if self._is_method is None:
+            node = self._node
+            self._is_method = isinstance(node, FUNCTION_TYPES) and is_method(node)
+        return self._is_method
+
+    @property
+    def decorator_names(self) -> frozenset[str]:
+        """Collect plain-name decorators once per node, shared by all principles."""
+        if self._decorator_names is None:
+            decorators = getattr(self._node, "decorator_list", None)
+            # Most definitions are undecorated: share one empty set for them
+            self._decorator_names = (
+                frozenset(
+                    decorator.id
+                    for decorator in decorators
+                    if type(decorator) is ast.Name
+                )
+                if decorators
+                else _NO_DECORATORS
+            )
+        return self._decorator_names
+
 
 class Principle(Protocol):
     """Protocol for Elegant Objects principles analysis."""
 
+    # Node types the principle reports on; other nodes are never passed to check
+    NODE_TYPES: ClassVar[tuple[type[ast.AST], ...]]
+    # Whether the principle only reports inside a class body
+    CLASS_SCOPED: ClassVar[bool]
+
     def check(self, source: Source) -> Violations:
         """Check source for violations and return list of detected violations."""
         ...
 
 
-def violation(node: ast.AST, message: str) -> Violations:
-    """Create a violation if node has location information."""
-    if hasattr(node, "lineno") and hasattr(node, "col_offset"):
-        return [Violation(node.lineno, node.col_offset, message)]
-    return []
+def violation(node: ast.stmt | ast.expr, message: str) -> Violation:
+    """Create a violation located at node."""
+    return Violation(node.lineno, node.col_offset, message)
+
+
+def walk(node: ast.AST) -> Iterator[ast.AST]:
+    """Yield node and its descendants in the same order as ast.walk."""
+    # Reads only pre-classified child fields, without a generator per node
+    todo = deque([node])
+    pop = todo.popleft
+    add = todo.append
+    child_fields = _CHILD_FIELDS
+    node_base = ast.AST
+    while todo:
+        node = pop()
+        fields = child_fields.get(type(node))
+        for field in node._fields if fields is None else fields:
+            value = getattr(node, field, None)
+            if type(value) is list:
+                for item in value:
+                    if isinstance(item, node_base):
+                        add(item)
+            elif isinstance(value, node_base):
+                add(value)
+        yield node
 
 
 def is_method(node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
@@ -134,47 +376,99 @@ def get_all_principles() -> list[Principle]:
     ]
 
 
+Dispatch = dict[type[ast.AST], tuple[Callable[[Source], Violations], ...]]
+
+
+@cache
+def shared_principles() -> tuple[Principle, ...]:
+    """Get the principle instances shared by every dispatch table in the process."""
+    return tuple(get_all_principles())
+
+
+@cache
+def principle_dispatch(in_class: bool = False) -> Dispatch:
+    """Map node types to the checks interested in them, built once per process."""
+    checks: dict[type[ast.AST], list[Callable[[Source], Violations]]] = {}
+    # Both scope tables reuse the same stateless instances; whole-tree data
+    # lives on the run's TreeIndex
+    for principle in shared_principles():
+        # Class-scoped checks are never entered for module-level code
+        if principle.CLASS_SCOPED and not in_class:
+            continue
+        for node_type in principle.NODE_TYPES:
+            checks.setdefault(node_type, []).append(principle.check)
+    # Shared by every core in the process, so freeze the per-type check lists
+    return {node_type: tuple(found) for node_type, found in checks.items()}
+
+
+@cache
+def skipped_leaves() -> frozenset[type[ast.AST]]:
+    """Return leaf node types that no principle checks, built once per process."""
+    return _LEAF_TYPES.difference(principle_dispatch(in_class=True))
+
+
 class ElegantObjectsCore:
     """Core analyzer for Elegant Objects violations."""
 
+    __slots__ = ("_class_dispatch", "_dispatch", "_leaves", "tree")
+
     def __init__(self, tree: ast.AST) -> None:
         self.tree = tree
+        # Node type -> checks interested in it, so each node costs one dict lookup;
+        # principles are stateless, so every core shares them
+        self._dispatch = principle_dispatch()
+        self._class_dispatch = principle_dispatch(in_class=True)
+        self._leaves = skipped_leaves()
 
     def check_violations(self) -> list[Violation]:
         """Check for all violations in the AST tree."""
-        violations = []
-        for violation in self._visit(self.tree, None):
-            violations.append(violation)
-        return violations
-
-    def _visit(
-        self, node: ast.AST, current_class: ast.ClassDef | None = None
-    ) -> list[Violation]:
-        """Visit AST nodes and check for violations."""
-        violations = []
-
-        if isinstance(node, ast.ClassDef):
-            current_class = node
-
-        # Check principles on current node
-        violations.extend(self._check_principles(node, current_class))
-
-        # Visit child nodes
-        for child in ast.iter_child_nodes(node):
-            violations.extend(self._visit(child, current_class))
-
-        return violations
-
-    def _check_principles(
-        self, node: ast.AST, current_class: ast.ClassDef | None
-    ) -> list[Violation]:
-        """Check all principles against the given node."""
-        violations = []
-        source = Source(node, current_class, self.tree)
-        principles = get_all_principles()
-
-        for principle in principles:
-            principle_violations = principle.check(source)
-            violations.extend(principle_violations)
-
-        return violations
+        return list(self.iter_violations())
+
+    def iter_violations(self) -> Iterator[Violation]:
+        """Visit AST nodes depth-first and yield violations as they are found."""
+        # Explicit stack instead of recursion: no frame per node, no RecursionError
+        tree = self.tree
+        # Whole-tree indexes live for this run only
+        index = TreeIndex(tree)
+        stack: list[tuple[ast.AST, ast.ClassDef | None]] = [(tree, None)]
+        pop = stack.pop
+        push = stack.extend
+        child_fields = _CHILD_FIELDS
+        node_base = ast.AST
+        module_dispatch = self._dispatch
+        class_dispatch = self._class_dispatch
+        leaves = self._leaves
+        while stack:
+            node, current_class = pop()
+
+            if type(node) is ast.ClassDef:
+                current_class = node
+
+            # Check principles on current node; most node types have none
+            dispatch = module_dispatch if current_class is None else class_dispatch
+            checks = dispatch.get(type(node))
+            if checks:
+                source = Source(node, current_class, tree, index)
+                for check in checks:
+                    found = check(source)
+                    if found:
+                        yield from found
+
+            # Inline equivalent of ast.iter_child_nodes over pre-classified fields,
+            # without a generator per node
+            children: list[tuple[ast.AST, ast.ClassDef | None]] = []
+            add = children.append
+            fields = child_fields.get(type(node))
+            for field in node._fields if fields is None else fields:
+                value = getattr(node, field, None)
+                if type(value) is list:
+                    for item in value:
+                        if isinstance(item, node_base) and type(item) not in leaves:
+                            add((item, current_class))
+                elif isinstance(value, node_base) and type(value) not in leaves:
+                    add((value, current_class))
+
+            # Push children reversed so they are popped in source order; reversing
+            # in place avoids the second list a [::-1] slice would allocate
+            children.reverse()
+            push(children)
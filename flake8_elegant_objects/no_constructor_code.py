@@ -1,45 +1,53 @@
 """No constructor code principle checker for Elegant Objects violations."""
 
 import ast
+from typing import ClassVar
 
-from .base import ErrorCodes, Source, Violations, is_method, violation
+from .base import FUNCTION_TYPES, ErrorCodes, Source, Violations, violation
 
 
 class NoConstructorCode:
     """Checks for code in constructors beyond parameter assignments (EO006)."""
 
+    __slots__ = ()
+
+    NODE_TYPES: ClassVar[tuple[type[ast.AST], ...]] = (
+        ast.FunctionDef,
+        ast.AsyncFunctionDef,
+    )
+    CLASS_SCOPED: ClassVar[bool] = False
+
     def check(self, source: Source) -> Violations:
         """Check source for constructor code violations."""
         node = source.node
-        if not isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-            return []
-        return self._check_constructor_code(node)
+        if not isinstance(node, FUNCTION_TYPES):
+            return ()
+        return self._check_constructor_code(node, source.is_method)
 
     def _check_constructor_code(
-        self, node: ast.FunctionDef | ast.AsyncFunctionDef
+        self, node: ast.FunctionDef | ast.AsyncFunctionDef, is_method: bool
     ) -> Violations:
         """Check for code in constructors beyond parameter assignments."""
-        if node.name != "__init__" or not is_method(node):
-            return []
+        if node.name != "__init__" or not is_method:
+            return ()
 
-        violations = []
         # Constructors should only contain assignments to self.attribute = parameter
-        for stmt in node.body:
-            if isinstance(stmt, ast.Assign):
-                # Check if it's a simple self.attr = param assignment
-                if len(stmt.targets) == 1 and isinstance(
-                    stmt.targets[0], ast.Attribute
-                ):
-                    target = stmt.targets[0]
-                    if isinstance(target.value, ast.Name) and target.value.id == "self":
-                        # This is a self.attr assignment, check if value is a simple name
-                        if not isinstance(stmt.value, ast.Name):
-                            violations.extend(violation(stmt, ErrorCodes.EO006))
-                    else:
-                        violations.extend(violation(stmt, ErrorCodes.EO006))
-                else:
-                    violations.extend(violation(stmt, ErrorCodes.EO006))
-            elif not isinstance(stmt, ast.Pass):  # Allow pass statements
-                violations.extend(violation(stmt, ErrorCodes.EO006))
-
-        return violations
+        return [
+            violation(stmt, ErrorCodes.EO006)
+            for stmt in node.body
+            if not self._is_allowed_statement(stmt)
+        ]
+
+    def _is_allowed_statement(self, stmt: ast.stmt) -> bool:
+        """Check if statement is a pass or a plain self.attr = param assignment."""
+        if type(stmt) is ast.Pass:
+            return True
+        if type(stmt) is not ast.Assign or len(stmt.targets) != 1:
+            return False
+        target = stmt.targets[0]
+        return (
+            type(target) is ast.Attribute
+            and type(target.value) is ast.Name
+            and target.value.id == "self"
+            and type(stmt.value) is ast.Name
+        )
@@ -1,209 +1,294 @@
 """Naming violations checker for Elegant Objects principles."""
 
 import ast
+from collections.abc import Iterable
+import functools
 import re
 from typing import ClassVar
 
-from .base import ErrorCodes, Source, Violations, is_method, violation
+from .base import ErrorCodes, Source, Violation, Violations, named, violation
+
+_TrieNode = dict[str, "_TrieNode"]
+
+# Marks the end of a suffix (identifier characters are never empty)
+_SUFFIX_END = ""
+
+# Lowercase word runs of an already lowercased name
+_WORD_RE = re.compile(r"[a-z]+")
+
+# First snake_case/camelCase word: stops at an underscore or a lower->upper boundary
+_FIRST_WORD_RE = re.compile(r"[^_]*?[a-z](?=[A-Z])|[^_]+")
+
+
+# Identifiers repeat heavily within and across files, so tokenize each once
+@functools.lru_cache(maxsize=4096)
+def _words(name: str) -> tuple[str, ...]:
+    """Split a lowercased name into its alphabetic words."""
+    return tuple(_WORD_RE.findall(name))
+
+
+@functools.lru_cache(maxsize=4096)
+def _first_word(name: str) -> str:
+    """Return the lowercased first snake_case/camelCase word of a name."""
+    match = _FIRST_WORD_RE.search(name)
+    if match is None:
+        return ""
+    return match.group(0).lower()
+
+
+class SuffixTrie:
+    """Trie over reversed suffixes for single-pass suffix matching."""
+
+    __slots__ = ("_min_length", "_root")
+
+    def __init__(self, suffixes: Iterable[str]) -> None:
+        suffixes = tuple(suffixes)
+        self._root: _TrieNode = {}
+        # Names shorter than every suffix are rejected without walking
+        self._min_length = min(map(len, suffixes), default=0)
+        for suffix in suffixes:
+            node = self._root
+            for char in reversed(suffix):
+                node = node.setdefault(char, {})
+            node[_SUFFIX_END] = {}
+
+    def matches(self, name: str) -> bool:
+        """Check if name ends with any of the suffixes."""
+        if len(name) < self._min_length:
+            return False
+        node = self._root
+        for char in reversed(name):
+            child = node.get(char)
+            if child is None:
+                return False
+            if _SUFFIX_END in child:
+                return True
+            node = child
+        return False
 
 
 class NoErName:
     """Checks for naming violations in classes, methods, variables, and functions."""
 
+    __slots__ = ()
+
+    NODE_TYPES: ClassVar[tuple[type[ast.AST], ...]] = (
+        ast.ClassDef,
+        ast.FunctionDef,
+        ast.AsyncFunctionDef,
+        ast.Assign,
+        ast.AnnAssign,
+    )
+    CLASS_SCOPED: ClassVar[bool] = False
+
     # Hall of shame: common -er suffixes (from elegantobjects.org)
-    ER_SUFFIXES: ClassVar[set[str]] = {
-        "accumulator",
-        "adapter",
-        "aggregator",
-        "analyzer",
-        "broker",
-        "builder",
-        "calculator",
-        "checker",
-        "collector",
-        "compiler",
-        "compressor",
-        "consumer",
-        "controller",
-        "converter",
-        "coordinator",
-        "creator",
-        "decoder",
-        "decompressor",
-        "deserializer",
-        "dispatcher",
-        "displayer",
-        "encoder",
-        "evaluator",
-        "executor",
-        "exporter",
-        "factory",
-        "fetcher",
-        "filter",
-        "finder",
-        "formatter",
-        "generator",
-        "handler",
-        "helper",
-        "importer",
-        "interpreter",
-        "joiner",
-        "listener",
-        "loader",
-        "manager",
-        "mediator",
-        "merger",
-        "monitor",
-        "observer",
-        "orchestrator",
-        "organizer",
-        "parser",
-        "printer",
-        "processor",
-        "producer",
-        "provider",
-        "reader",
-        "renderer",
-        "reporter",
-        "router",
-        "runner",
-        "saver",
-        "scanner",
-        "scheduler",
-        "serializer",
-        "sorter",
-        "splitter",
-        "supplier",
-        "synchronizer",
-        "tracker",
-        "transformer",
-        "validator",
-        "worker",
-        "wrapper",
-        "writer",
-    }
+    ER_SUFFIXES: ClassVar[frozenset[str]] = frozenset(
+        {
+            "accumulator",
+            "adapter",
+            "aggregator",
+            "analyzer",
+            "broker",
+            "builder",
+            "calculator",
+            "checker",
+            "collector",
+            "compiler",
+            "compressor",
+            "consumer",
+            "controller",
+            "converter",
+            "coordinator",
+            "creator",
+            "decoder",
+            "decompressor",
+            "deserializer",
+            "dispatcher",
+            "displayer",
+            "encoder",
+            "evaluator",
+            "executor",
+            "exporter",
+            "factory",
+            "fetcher",
+            "filter",
+            "finder",
+            "formatter",
+            "generator",
+            "handler",
+            "helper",
+            "importer",
+            "interpreter",
+            "joiner",
+            "listener",
+            "loader",
+            "manager",
+            "mediator",
+            "merger",
+            "monitor",
+            "observer",
+            "orchestrator",
+            "organizer",
+            "parser",
+            "printer",
+            "processor",
+            "producer",
+            "provider",
+            "reader",
+            "renderer",
+            "reporter",
+            "router",
+            "runner",
+            "saver",
+            "scanner",
+            "scheduler",
+            "serializer",
+            "sorter",
+            "splitter",
+            "supplier",
+            "synchronizer",
+            "tracker",
+            "transformer",
+            "validator",
+            "worker",
+            "wrapper",
+            "writer",
+        }
+    )
+
+    # Shared by all instances, built once at import time
+    ER_SUFFIX_TRIE: ClassVar[SuffixTrie] = SuffixTrie(ER_SUFFIXES)
 
     # Common procedural verbs that should be nouns
-    PROCEDURAL_VERBS: ClassVar[set[str]] = {
-        "accumulate",
-        "add",
-        "aggregate",
-        "analyze",
-        "append",
-        "build",
-        "calculate",
-        "change",
-        "check",
-        "clean",
-        "clear",
-        "close",
-        "collect",
-        "compile",
-        "compress",
-        "control",
-        "convert",
-        "create",
-        "decode",
-        "decompress",
-        "delete",
-        "deserialize",
-        "dispatch",
-        "display",
-        "do",
-        "encode",
-        "evaluate",
-        "execute",
-        "export",
-        "fetch",
-        "filter",
-        "find",
-        "format",
-        "generate",
-        "get",
-        "handle",
-        "hide",
-        "import",
-        "insert",
-        "interpret",
-        "join",
-        "load",
-        "manage",
-        "merge",
-        "modify",
-        "open",
-        "organize",
-        "parse",
-        "pause",
-        "prepend",
-        "print",
-        "process",
-        "put",
-        "read",
-        "receive",
-        "refresh",
-        "remove",
-        "render",
-        "reset",
-        "resume",
-        "retrieve",
-        "route",
-        "run",
-        "save",
-        "schedule",
-        "search",
-        "send",
-        "serialize",
-        "set",
-        "show",
-        "sort",
-        "split",
-        "start",
-        "stop",
-        "store",
-        "transform",
-        "transmit",
-        "update",
-        "validate",
-        "write",
-    }
+    PROCEDURAL_VERBS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "accumulate",
+            "add",
+            "aggregate",
+            "analyze",
+            "append",
+            "build",
+            "calculate",
+            "change",
+            "check",
+            "clean",
+            "clear",
+            "close",
+            "collect",
+            "compile",
+            "compress",
+            "control",
+            "convert",
+            "create",
+            "decode",
+            "decompress",
+            "delete",
+            "deserialize",
+            "dispatch",
+            "display",
+            "do",
+            "encode",
+            "evaluate",
+            "execute",
+            "export",
+            "fetch",
+            "filter",
+            "find",
+            "format",
+            "generate",
+            "get",
+            "handle",
+            "hide",
+            "import",
+            "insert",
+            "interpret",
+            "join",
+            "load",
+            "manage",
+            "merge",
+            "modify",
+            "open",
+            "organize",
+            "parse",
+            "pause",
+            "prepend",
+            "print",
+            "process",
+            "put",
+            "read",
+            "receive",
+            "refresh",
+            "remove",
+            "render",
+            "reset",
+            "resume",
+            "retrieve",
+            "route",
+            "run",
+            "save",
+            "schedule",
+            "search",
+            "send",
+            "serialize",
+            "set",
+            "show",
+            "sort",
+            "split",
+            "start",
+            "stop",
+            "store",
+            "transform",
+            "transmit",
+            "update",
+            "validate",
+            "write",
+        }
+    )
+
+    # Common property patterns
+    PROPERTY_NAMES: ClassVar[frozenset[str]] = frozenset(
+        {"property", "getter", "setter"}
+    )
 
     # Allowed exceptions (common patterns that are OK)
-    ALLOWED_EXCEPTIONS: ClassVar[set[str]] = {
-        "buffer",
-        "character",
-        "cluster",
-        "container",
-        "counter",
-        "error",
-        "footer",
-        "header",
-        "identifier",
-        "number",
-        "order",
-        "owner",
-        "parameter",
-        "pointer",
-        "register",
-        "server",
-        "timer",
-        "user",
-    }
+    ALLOWED_EXCEPTIONS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "buffer",
+            "character",
+            "cluster",
+            "container",
+            "counter",
+            "error",
+            "footer",
+            "header",
+            "identifier",
+            "number",
+            "order",
+            "owner",
+            "parameter",
+            "pointer",
+            "register",
+            "server",
+            "timer",
+            "user",
+        }
+    )
 
     def check(self, source: Source) -> Violations:
         """Check source for naming violations."""
-        violations = []
         node = source.node
-
-        if isinstance(node, ast.ClassDef):
-            violations.extend(self._check_class_name(node))
-        elif isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-            violations.extend(self._check_function_name(node))
-        elif isinstance(node, ast.Assign):
-            violations.extend(self._check_variable_assignment(node))
-        elif isinstance(node, ast.AnnAssign):
-            violations.extend(self._check_annotated_assignment(node))
-
-        return violations
+        # Ordered by how common each node type is in typical modules
+        if type(node) is ast.Assign:
+            return self._check_variable_assignment(node)
+        if type(node) is ast.FunctionDef:
+            return self._check_function_name(node, source.is_method)
+        if type(node) is ast.AnnAssign:
+            return self._check_annotated_assignment(node)
+        if type(node) is ast.ClassDef:
+            return self._check_class_name(node)
+        if type(node) is ast.AsyncFunctionDef:
+            return self._check_function_name(node, source.is_method)
+        return ()
 
     def _check_class_name(self, node: ast.ClassDef) -> Violations:
         """Check if class name violates -er principle."""
@@ -211,42 +296,38 @@ class NoErName:
 
         # Skip if it's an allowed exception
         if name in self.ALLOWED_EXCEPTIONS:
-            return []
-
-        # Check for -er suffixes (the hall of shame)
-        for suffix in self.ER_SUFFIXES:
-            if name.endswith(suffix):
-                return violation(node, ErrorCodes.EO001.format(name=node.name))
+            return ()
 
-        # Check for procedural patterns in compound names
-        if self._contains_procedural_pattern(name):
-            return violation(node, ErrorCodes.EO001.format(name=node.name))
+        # Check for -er suffixes (the hall of shame) or procedural patterns in
+        # compound names; both report the same violation, so stop at the first hit
+        if self.ER_SUFFIX_TRIE.matches(name) or self._contains_procedural_pattern(name):
+            return (violation(node, named(ErrorCodes.EO001, node.name)),)
 
-        return []
+        return ()
 
     def _check_function_name(
-        self, node: ast.FunctionDef | ast.AsyncFunctionDef
+        self, node: ast.FunctionDef | ast.AsyncFunctionDef, is_method: bool
     ) -> Violations:
         """Check if function/method name violates -er principle."""
         # Skip special methods (__init__, __str__, etc.)
         if node.name.startswith("_"):
-            return []
+            return ()
 
         # Skip common property patterns
-        if node.name in ("property", "getter", "setter"):
-            return []
+        if node.name in self.PROPERTY_NAMES:
+            return ()
 
         # Check for procedural verbs
         if self._starts_with_procedural_verb(node.name):
             # Determine if it's a method or standalone function
-            error_code = ErrorCodes.EO002 if is_method(node) else ErrorCodes.EO004
-            return violation(node, error_code.format(name=node.name))
+            error_code = ErrorCodes.EO002 if is_method else ErrorCodes.EO004
+            return (violation(node, named(error_code, node.name)),)
 
-        return []
+        return ()
 
     def _check_variable_assignment(self, node: ast.Assign) -> Violations:
         """Check variable names in assignments."""
-        violations = []
+        violations: list[Violation] = []
         for target in node.targets:
             if isinstance(target, ast.Name):
                 violations.extend(self._check_variable_name(target))
@@ -256,51 +337,32 @@ class NoErName:
         """Check variable names in annotated assignments."""
         if isinstance(node.target, ast.Name):
             return self._check_variable_name(node.target)
-        return []
+        return ()
 
     def _check_variable_name(self, node: ast.Name) -> Violations:
         """Check if variable name violates -er principle."""
         # Skip private variables and common patterns
         if node.id.startswith("_") or node.id.isupper():
-            return []
+            return ()
 
         name = node.id.lower()
 
         # Skip if it's an allowed exception
         if name in self.ALLOWED_EXCEPTIONS:
-            return []
-
-        # Check for -er suffixes
-        for suffix in self.ER_SUFFIXES:
-            if name.endswith(suffix):
-                return violation(node, ErrorCodes.EO003.format(name=node.id))
+            return ()
 
-        # Check for procedural verbs as variable names
-        if self._starts_with_procedural_verb(name):
-            return violation(node, ErrorCodes.EO003.format(name=node.id))
+        # Check for -er suffixes or procedural verbs as variable names
+        if self.ER_SUFFIX_TRIE.matches(name) or self._starts_with_procedural_verb(name):
+            return (violation(node, named(ErrorCodes.EO003, node.id)),)
 
-        return []
+        return ()
 
     def _contains_procedural_pattern(self, name: str) -> bool:
         """Check if name contains procedural patterns."""
-        # Split camelCase/snake_case into words
-        words = re.findall(r"[a-z]+", name)
-
-        # Check if any word is a procedural verb
-        return any(word in self.PROCEDURAL_VERBS for word in words)
+        # Check if any word is a procedural verb (set intersection runs in C)
+        return not self.PROCEDURAL_VERBS.isdisjoint(_words(name))
 
     def _starts_with_procedural_verb(self, name: str) -> bool:
         """Check if name starts with a procedural verb."""
-        # Split camelCase/snake_case and check first word
-        # First split on underscores, then on camelCase boundaries
-        words: list[str] = []
-        for part in name.split("_"):
-            # Split camelCase: insert space before uppercase letters
-            camel_split = re.sub(r"([a-z])([A-Z])", r"\1 \2", part)
-            words.extend(word.lower() for word in camel_split.split() if word)
-
-        if not words:
-            return False
-
-        first_word = words[0]
-        return first_word in self.PROCEDURAL_VERBS
+        # Only the first snake_case/camelCase word matters
+        return _first_word(name) in self.PROCEDURAL_VERBS
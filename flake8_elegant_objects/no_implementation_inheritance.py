@@ -1,75 +1,84 @@
 """No implementation inheritance principle checker for Elegant Objects violations."""
 
 import ast
+from typing import ClassVar
 
-from .base import ErrorCodes, Source, Violations, violation
+from .base import ErrorCodes, Source, Violations, named, violation
 
 
 class NoImplementationInheritance:
     """Checks for implementation inheritance violations (EO014)."""
 
+    __slots__ = ()
+
+    NODE_TYPES: ClassVar[tuple[type[ast.AST], ...]] = (ast.ClassDef,)
+    CLASS_SCOPED: ClassVar[bool] = False
+
+    # Allow inheritance from abstract base classes and common patterns
+    ALLOWED_BASES: ClassVar[frozenset[str]] = frozenset(
+        {
+            # Abstract bases
+            "ABC",
+            "Protocol",
+            # Exception hierarchy (standard pattern)
+            "Exception",
+            "BaseException",
+            "ValueError",
+            "TypeError",
+            "RuntimeError",
+            "AttributeError",
+            "KeyError",
+            "IndexError",
+            "ImportError",
+            "OSError",
+            # Standard library abstract bases
+            "Enum",
+            "IntEnum",
+            "Flag",
+            "IntFlag",
+            # Generic object (unavoidable in Python)
+            "object",
+        }
+    )
+
+    # module.AbstractBase patterns
+    ALLOWED_ATTRS: ClassVar[frozenset[str]] = frozenset({"Protocol", "ABC"})
+    ALLOWED_MODULES: ClassVar[frozenset[str]] = frozenset(
+        {"abc", "typing", "collections", "enum"}
+    )
+    ABSTRACT_ATTRS: ClassVar[frozenset[str]] = frozenset(
+        {"ABC", "abstractmethod", "Protocol"}
+    )
+
     def check(self, source: Source) -> Violations:
         """Check source for implementation inheritance violations."""
         node = source.node
 
-        if isinstance(node, ast.ClassDef):
+        if type(node) is ast.ClassDef:
             return self._check_implementation_inheritance(node)
 
-        return []
+        return ()
 
     def _check_implementation_inheritance(self, node: ast.ClassDef) -> Violations:
         """Check for implementation inheritance violations."""
         for base in node.bases:
-            is_abstract_base = False
-
-            if isinstance(base, ast.Name):
-                # Allow inheritance from abstract base classes and common patterns
-                allowed_bases = {
-                    # Abstract bases
-                    "ABC",
-                    "Protocol",
-                    # Exception hierarchy (standard pattern)
-                    "Exception",
-                    "BaseException",
-                    "ValueError",
-                    "TypeError",
-                    "RuntimeError",
-                    "AttributeError",
-                    "KeyError",
-                    "IndexError",
-                    "ImportError",
-                    "OSError",
-                    # Standard library abstract bases
-                    "Enum",
-                    "IntEnum",
-                    "Flag",
-                    "IntFlag",
-                    # Generic object (unavoidable in Python)
-                    "object",
-                }
-                is_abstract_base = base.id in allowed_bases
-
-            elif isinstance(base, ast.Attribute):
-                # Check for module.AbstractBase patterns
-                if base.attr in {"Protocol", "ABC"}:
-                    is_abstract_base = True
-                elif isinstance(base.value, ast.Name) and base.value.id in {
-                    "abc",
-                    "typing",
-                    "collections",
-                    "enum",
-                }:
-                    is_abstract_base = True
-                # Check for imported ABC/Protocol
-                elif isinstance(base.value, ast.Name) and base.attr in {
-                    "ABC",
-                    "abstractmethod",
-                    "Protocol",
-                }:
-                    is_abstract_base = True
-
             # If not an abstract base, it's implementation inheritance
-            if not is_abstract_base:
-                return violation(node, ErrorCodes.EO014.format(name=node.name))
+            if not self._is_abstract_base(base):
+                return (violation(node, named(ErrorCodes.EO014, node.name)),)
+
+        return ()
+
+    def _is_abstract_base(self, base: ast.expr) -> bool:
+        """Check if a base class expression names an allowed abstract base."""
+        if type(base) is ast.Name:
+            return base.id in self.ALLOWED_BASES
+
+        if type(base) is ast.Attribute:
+            # Check for module.AbstractBase patterns and imported ABC/Protocol
+            attr = base.attr
+            if attr in self.ABSTRACT_ATTRS:
+                return attr in self.ALLOWED_ATTRS or type(base.value) is ast.Name
+            module = base.value
+            return type(module) is ast.Name and module.id in self.ALLOWED_MODULES
 
-        return []
+        return False
@@ -1,127 +1,134 @@
 """No impure tests principle checker for Elegant Objects violations."""
 
 import ast
+from typing import ClassVar
 
-from .base import ErrorCodes, Source, Violations, violation
+from .base import (
+    FUNCTION_TYPES,
+    ErrorCodes,
+    Source,
+    Violation,
+    Violations,
+    named,
+    violation,
+)
 
 
 class NoImpureTests:
     """Checks for impure test methods violations (EO012)."""
 
+    __slots__ = ()
+
+    NODE_TYPES: ClassVar[tuple[type[ast.AST], ...]] = (
+        ast.FunctionDef,
+        ast.AsyncFunctionDef,
+    )
+    CLASS_SCOPED: ClassVar[bool] = False
+
+    # Context managers that assert, like pytest.raises
+    ASSERTION_CONTEXTS: ClassVar[frozenset[str]] = frozenset({"raises", "assertRaises"})
+
     def check(self, source: Source) -> Violations:
         """Check source for impure test method violations."""
         node = source.node
 
-        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+        if isinstance(node, FUNCTION_TYPES):
             return self._check_test_methods(node)
 
-        return []
+        return ()
 
     def _check_test_methods(
         self, node: ast.FunctionDef | ast.AsyncFunctionDef
     ) -> Violations:
         """Check that test methods only contain single assertion statements."""
         if not node.name.startswith("test_"):
-            return []
+            return ()
 
-        violations = []
+        violations: list[Violation] = []
+        # Bound once: the loop below reports per statement with the same message
+        append = violations.append
+        message = named(ErrorCodes.EO012, node.name)
         assertion_count = 0
 
         for stmt in node.body:
-            if isinstance(stmt, ast.Pass):
+            if type(stmt) is ast.Pass:
                 continue  # Allow pass statements
 
-            elif isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Call):
+            elif type(stmt) is ast.Expr and type(stmt.value) is ast.Call:
                 # Check if it's an assertion
                 if self._is_assertion_call(stmt.value):
                     assertion_count += 1
                     continue
                 else:
                     # Non-assertion expression call
-                    violations.extend(
-                        violation(stmt, ErrorCodes.EO012.format(name=node.name))
-                    )
+                    append(violation(stmt, message))
 
-            elif isinstance(stmt, ast.Assert):
+            elif type(stmt) is ast.Assert:
                 # Direct assert statement
                 assertion_count += 1
                 continue
 
-            elif isinstance(stmt, ast.With):
+            elif type(stmt) is ast.With:
                 # Check for pytest.raises or similar context managers
                 if self._is_assertion_context_manager(stmt):
                     assertion_count += 1
                     continue
                 else:
-                    violations.extend(
-                        violation(stmt, ErrorCodes.EO012.format(name=node.name))
-                    )
+                    append(violation(stmt, message))
 
             else:
                 # Any other statement (assignments, etc.) is a violation
-                violations.extend(
-                    violation(stmt, ErrorCodes.EO012.format(name=node.name))
-                )
+                append(violation(stmt, message))
 
         # Test must have exactly one assertion
-        if assertion_count == 0:
-            violations.extend(violation(node, ErrorCodes.EO012.format(name=node.name)))
-        elif assertion_count > 1:
-            violations.extend(violation(node, ErrorCodes.EO012.format(name=node.name)))
+        if assertion_count != 1:
+            append(violation(node, message))
 
         return violations
 
     def _is_assertion_call(self, call: ast.Call) -> bool:
         """Check if a call is an assertion."""
-        # Check for unittest style assertions (self.assertEqual, self.assertTrue, etc.)
-        if isinstance(call.func, ast.Attribute):
-            if call.func.attr.startswith("assert"):
-                return True
-            # Check for chained assertions like assertThat(...).isEqualTo(...)
-            if self._contains_assertion_in_chain(call):
-                return True
+        func = call.func
 
-        # Check for standalone assertion functions
-        if isinstance(call.func, ast.Name):
-            if call.func.id.startswith("assert") or call.func.id == "assertThat":
-                return True
+        # Check for standalone assertion functions (assertThat included)
+        if type(func) is ast.Name:
+            return func.id.startswith("assert")
+
+        # Check for unittest style assertions (self.assertEqual, self.assertTrue, etc.)
+        # and chained assertions like assertThat(...).isEqualTo(...)
+        if type(func) is ast.Attribute:
+            return func.attr.startswith("assert") or self._contains_assertion_in_chain(
+                call
+            )
 
         return False
 
     def _contains_assertion_in_chain(self, call: ast.Call) -> bool:
         """Check if assertion exists anywhere in the call chain."""
-        current = call
-        while isinstance(current, ast.Call):
-            if isinstance(current.func, ast.Name):
-                if (
-                    current.func.id.startswith("assert")
-                    or current.func.id == "assertThat"
-                ):
-                    return True
-            elif isinstance(current.func, ast.Attribute):
-                if (
-                    current.func.attr.startswith("assert")
-                    or current.func.attr == "assertThat"
-                ):
-                    return True
-                # Move to the next level in the chain
-                if isinstance(current.func.value, ast.Call):
-                    current = current.func.value
-                else:
-                    break
-            else:
-                break
+        current: ast.expr = call
+        # Each link is a call on an attribute of the previous call, if any
+        while type(current) is ast.Call:
+            func = current.func
+            if type(func) is ast.Name:
+                return func.id.startswith("assert")
+            if type(func) is not ast.Attribute:
+                return False
+            if func.attr.startswith("assert"):
+                return True
+            current = func.value
         return False
 
     def _is_assertion_context_manager(self, with_stmt: ast.With) -> bool:
         """Check if with statement is for assertions like pytest.raises."""
         for item in with_stmt.items:
-            if isinstance(item.context_expr, ast.Call):
-                if isinstance(item.context_expr.func, ast.Attribute):
-                    # Check for pytest.raises, unittest.assertRaises, etc.
-                    if item.context_expr.func.attr in {"raises", "assertRaises"}:
+            context = item.context_expr
+            if type(context) is ast.Call:
+                func = context.func
+                # Check for pytest.raises, unittest.assertRaises, etc.
+                if type(func) is ast.Attribute:
+                    if func.attr in self.ASSERTION_CONTEXTS:
                         return True
-                elif isinstance(item.context_expr.func, ast.Name):
-                    if item.context_expr.func.id in {"raises", "assertRaises"}:
+                elif type(func) is ast.Name:
+                    if func.id in self.ASSERTION_CONTEXTS:
                         return True
         return False
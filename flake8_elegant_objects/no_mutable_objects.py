@@ -1,69 +1,86 @@
 """No mutable objects principle checker for Elegant Objects violations."""
 
 import ast
+from typing import ClassVar
 
-from .base import ErrorCodes, Source, Violations, violation
+from .base import ErrorCodes, Source, Violation, Violations, named, violation
 
 
 class NoMutableObjects:
     """Checks for mutable object violations (EO008)."""
 
+    __slots__ = ()
+
+    NODE_TYPES: ClassVar[tuple[type[ast.AST], ...]] = (ast.ClassDef,)
+    CLASS_SCOPED: ClassVar[bool] = False
+
+    MUTABLE_TYPES: ClassVar[frozenset[str]] = frozenset(
+        {"list", "dict", "set", "bytearray"}
+    )
+
+    MUTABLE_LITERALS: ClassVar[frozenset[type[ast.AST]]] = frozenset(
+        {ast.List, ast.Dict, ast.Set}
+    )
+
     def check(self, source: Source) -> Violations:
         """Check source for mutable object violations."""
         node = source.node
-        if not isinstance(node, ast.ClassDef):
-            return []
+        if type(node) is not ast.ClassDef:
+            return ()
         return self._check_mutable_class(node)
 
     def _check_mutable_class(self, node: ast.ClassDef) -> Violations:
         """Check for mutable class violations."""
-        violations = []
+        violations: list[Violation] = []
 
         # Look for @dataclass decorator without frozen=True
-        has_dataclass = False
-        has_frozen = False
-
-        for decorator in node.decorator_list:
-            if isinstance(decorator, ast.Name) and decorator.id == "dataclass":
-                has_dataclass = True
-            elif isinstance(decorator, ast.Call):
-                if (
-                    isinstance(decorator.func, ast.Name)
-                    and decorator.func.id == "dataclass"
-                ):
-                    has_dataclass = True
-                    # Check for frozen=True
-                    for keyword in decorator.keywords:
-                        if keyword.arg == "frozen" and isinstance(
-                            keyword.value, ast.Constant
-                        ):
-                            if keyword.value.value is True:
-                                has_frozen = True
-
-        # If it's a dataclass without frozen=True, it's mutable
-        if has_dataclass and not has_frozen:
-            violations.extend(violation(node, ErrorCodes.EO008.format(name=node.name)))
+        if node.decorator_list:
+            is_dataclass, is_frozen = self._dataclass_flags(node.decorator_list)
+            # frozen=True only freezes instances: class-level values below are
+            # still shared and mutable, so the body is scanned regardless
+            if is_dataclass and not is_frozen:
+                violations.append(violation(node, named(ErrorCodes.EO008, node.name)))
 
         # Check for mutable instance attributes in class body
+        append = violations.append
         for stmt in node.body:
-            if isinstance(stmt, ast.Assign):
+            # The value is shared by all targets, so classify it once
+            if type(stmt) is ast.Assign and self._is_mutable_type(stmt.value):
                 for target in stmt.targets:
-                    if isinstance(target, ast.Name):
-                        # This is a class attribute, check if it's mutable
-                        if self._is_mutable_type(stmt.value):
-                            violations.extend(
-                                violation(stmt, ErrorCodes.EO008.format(name=target.id))
-                            )
+                    if type(target) is ast.Name:
+                        # This is a class attribute holding a mutable value
+                        append(violation(stmt, named(ErrorCodes.EO008, target.id)))
 
         return violations
 
+    def _dataclass_flags(self, decorators: list[ast.expr]) -> tuple[bool, bool]:
+        """Return whether decorators declare a dataclass and whether it is frozen."""
+        is_dataclass = False
+        for decorator in decorators:
+            if type(decorator) is ast.Name:
+                if decorator.id == "dataclass":
+                    is_dataclass = True
+            elif type(decorator) is ast.Call:
+                func = decorator.func
+                if type(func) is ast.Name and func.id == "dataclass":
+                    is_dataclass = True
+                    # Check for frozen=True; nothing can unfreeze it afterwards
+                    for keyword in decorator.keywords:
+                        if (
+                            keyword.arg == "frozen"
+                            and type(keyword.value) is ast.Constant
+                            and keyword.value.value is True
+                        ):
+                            return True, True
+        return is_dataclass, False
+
     def _is_mutable_type(self, node: ast.AST) -> bool:
         """Check if a node represents a mutable type."""
-        if isinstance(node, ast.List | ast.Dict | ast.Set):
+        if type(node) in self.MUTABLE_LITERALS:
             return True
 
-        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
-            mutable_types = {"list", "dict", "set", "bytearray"}
-            return node.func.id in mutable_types
+        if type(node) is ast.Call:
+            func = node.func
+            return type(func) is ast.Name and func.id in self.MUTABLE_TYPES
 
         return False
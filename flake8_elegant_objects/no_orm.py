@@ -1,28 +1,21 @@
 """No ORM principle checker for Elegant Objects violations."""
 
 import ast
+from typing import ClassVar
 
-from .base import ErrorCodes, Source, Violations, violation
+from .base import ErrorCodes, Source, Violations, named, violation
 
 
 class NoOrm:
     """Checks for ORM/ActiveRecord pattern violations (EO013)."""
 
-    def check(self, source: Source) -> Violations:
-        """Check source for ORM pattern violations."""
-        node = source.node
-
-        if isinstance(node, ast.Call):
-            return self._check_orm_patterns(node)
-
-        return []
+    __slots__ = ()
 
-    def _check_orm_patterns(self, node: ast.Call) -> Violations:
-        """Check for ORM/ActiveRecord patterns."""
-        if not isinstance(node.func, ast.Attribute):
-            return []
+    NODE_TYPES: ClassVar[tuple[type[ast.AST], ...]] = (ast.Call,)
+    CLASS_SCOPED: ClassVar[bool] = False
 
-        orm_methods = {
+    ORM_METHODS: ClassVar[frozenset[str]] = frozenset(
+        {
             "save",
             "delete",
             "destroy",
@@ -56,42 +49,58 @@ class NoOrm:
             "add_column",
             "remove_column",
         }
-        if node.func.attr not in orm_methods:
-            return []
+    )
+
+    # Receivers whose methods are never ORM calls
+    BUILTIN_TYPES: ClassVar[frozenset[str]] = frozenset(
+        {"list", "dict", "set", "tuple", "str", "int", "float", "bool"}
+    )
+
+    # Literal receivers: "".join(...), [].insert(...), etc.
+    LITERAL_TYPES: ClassVar[frozenset[type[ast.AST]]] = frozenset(
+        {ast.Constant, ast.List, ast.Dict, ast.Tuple, ast.Set}
+    )
+
+    # Constructor calls whose results are never ORM objects
+    CONSTRUCTOR_FUNCS: ClassVar[frozenset[str]] = frozenset(
+        {"open", "int", "str", "list", "dict", "set", "tuple", "bool", "float"}
+    )
+
+    def check(self, source: Source) -> Violations:
+        """Check source for ORM pattern violations."""
+        node = source.node
+
+        if type(node) is ast.Call:
+            return self._check_orm_patterns(node)
+
+        return ()
+
+    def _check_orm_patterns(self, node: ast.Call) -> Violations:
+        """Check for ORM/ActiveRecord patterns."""
+        # Cheap name filter first: most calls are not ORM-like method names
+        func = node.func
+        if not isinstance(func, ast.Attribute) or func.attr not in self.ORM_METHODS:
+            return ()
 
         # Check if this is a valid non-ORM usage
-        if self._is_allowed_method_usage(node.func.value):
-            return []
+        if self._is_allowed_method_usage(func.value):
+            return ()
 
-        return violation(node, ErrorCodes.EO013.format(name=node.func.attr))
+        return (violation(node, named(ErrorCodes.EO013, func.attr)),)
 
     def _is_allowed_method_usage(self, value: ast.AST) -> bool:
         """Check if the method usage is allowed (not ORM)."""
-        # Built-in types
-        if isinstance(value, ast.Name) and value.id in {
-            "list",
-            "dict",
-            "set",
-            "tuple",
-            "str",
-            "int",
-            "float",
-            "bool",
-        }:
-            return True
-
-        # Allow methods on list/dict variables
-        if isinstance(value, ast.Name) and value.id.endswith("_list"):
-            return True
+        if isinstance(value, ast.Name):
+            # Built-in types, or methods on list/dict variables
+            return value.id in self.BUILTIN_TYPES or value.id.endswith("_list")
 
         # Literal values
-        if isinstance(value, ast.Constant | ast.List | ast.Dict | ast.Tuple | ast.Set):
+        if type(value) in self.LITERAL_TYPES:
             return True
 
         # Constructor calls
         return (
             isinstance(value, ast.Call)
             and isinstance(value.func, ast.Name)
-            and value.func.id
-            in {"open", "int", "str", "list", "dict", "set", "tuple", "bool", "float"}
+            and value.func.id in self.CONSTRUCTOR_FUNCS
         )
@@ -1,46 +1,66 @@
 """No public methods without contracts principle checker for Python."""
 
 import ast
+from typing import ClassVar
 
-from .base import ErrorCodes, Principle, Source, Violations, is_method, violation
+from .base import (
+    FUNCTION_TYPES,
+    ErrorCodes,
+    Source,
+    TreeIndex,
+    Violations,
+    named,
+    violation,
+)
 
 
-class NoPublicMethodsWithoutContracts(Principle):
+class NoPublicMethodsWithoutContracts:
     """Check that public methods are defined by contracts (Protocol/ABC)."""
 
+    __slots__ = ()
+
+    NODE_TYPES: ClassVar[tuple[type[ast.AST], ...]] = (ast.FunctionDef,)
+    CLASS_SCOPED: ClassVar[bool] = True
+
+    CONTRACT_BASES: ClassVar[frozenset[str]] = frozenset({"Protocol", "ABC", "ABCMeta"})
+
     def check(self, source: Source) -> Violations:
         """Check for public methods without contracts."""
-        violations: Violations = []
-
-        if not isinstance(source.node, ast.FunctionDef):
-            return violations
-
-        if not source.current_class or not is_method(source.node):
-            return violations
-
-        if source.node.name.startswith("_"):
-            return violations
-
-        if source.node.name.startswith("__") and source.node.name.endswith("__"):
-            return violations
-        if self._class_has_contract(source.current_class, source.tree):
-            if not self._method_from_contract(
-                source.node.name, source.current_class, source.tree
-            ):
-                violations.extend(
-                    violation(
-                        source.node, ErrorCodes.EO011.format(name=source.node.name)
-                    )
-                )
-        else:
-            violations.extend(
-                violation(source.node, ErrorCodes.EO011.format(name=source.node.name))
-            )
-
-        return violations
+        node = source.node
+        if type(node) is not ast.FunctionDef:
+            return ()
+
+        current_class = source.current_class
+        if not current_class or not source.is_method:
+            return ()
+
+        if node.name.startswith("_"):
+            return ()
+
+        if node.name.startswith("__") and node.name.endswith("__"):
+            return ()
+
+        index = source.index
+        if self._has_contract(current_class, index) and self._method_from_contract(
+            node.name, current_class, index
+        ):
+            return ()
+
+        return (violation(node, named(ErrorCodes.EO011, node.name)),)
+
+    def _has_contract(self, class_node: ast.ClassDef, index: TreeIndex | None) -> bool:
+        """Check once per class whether it implements any Protocol or ABC."""
+        if index is None:
+            return self._class_has_contract(class_node, index)
+        key = id(class_node)
+        has_contract = index.class_contracts.get(key)
+        if has_contract is None:
+            has_contract = self._class_has_contract(class_node, index)
+            index.class_contracts[key] = has_contract
+        return has_contract
 
     def _class_has_contract(
-        self, class_node: ast.ClassDef, tree: ast.AST | None
+        self, class_node: ast.ClassDef, index: TreeIndex | None
     ) -> bool:
         """Check if class implements any Protocol or ABC."""
         if not class_node.bases:
@@ -51,13 +71,13 @@ class NoPublicMethodsWithoutContracts(Principle):
             if not base_name:
                 continue
 
-            if self._is_protocol_or_abc(base_name, tree):
+            if self._is_protocol_or_abc(base_name, index):
                 return True
 
         return False
 
     def _method_from_contract(
-        self, method_name: str, class_node: ast.ClassDef, tree: ast.AST | None
+        self, method_name: str, class_node: ast.ClassDef, index: TreeIndex | None
     ) -> bool:
         """Check if method is defined in any of the class's contracts."""
         for base in class_node.bases:
@@ -65,14 +85,14 @@ class NoPublicMethodsWithoutContracts(Principle):
             if not base_name:
                 continue
 
-            base_class = self._find_class_def(base_name, tree)
+            base_class = self._find_class_def(base_name, index)
             if not base_class:
-                if self._is_protocol_or_abc(base_name, tree):
+                if self._is_protocol_or_abc(base_name, index):
                     return True
                 continue
 
             if self._has_method(base_class, method_name):
-                if self._is_protocol_or_abc(base_name, tree):
+                if self._is_protocol_or_abc(base_name, index):
                     return True
 
         return False
@@ -85,41 +105,46 @@ class NoPublicMethodsWithoutContracts(Principle):
             return base.attr
         return None
 
-    def _is_protocol_or_abc(self, class_name: str, tree: ast.AST | None) -> bool:
+    def _is_protocol_or_abc(self, class_name: str, index: TreeIndex | None) -> bool:
         """Check if a class is a Protocol or ABC."""
-        if class_name in ("Protocol", "ABC", "ABCMeta"):
+        if class_name in self.CONTRACT_BASES:
             return True
 
         if class_name.endswith("Protocol") or class_name.endswith("ABC"):
             return True
 
-        if tree:
-            class_def = self._find_class_def(class_name, tree)
-            if class_def:
-                for base in class_def.bases:
-                    base_name = self._get_base_name(base)
-                    if base_name and self._is_protocol_or_abc(base_name, None):
-                        return True
+        if index is not None:
+            # Every method of every subclass asks about the same few bases
+            is_contract = index.contract_names.get(class_name)
+            if is_contract is None:
+                is_contract = self._resolves_to_contract(class_name, index)
+                index.contract_names[class_name] = is_contract
+            return is_contract
 
         return False
 
+    def _resolves_to_contract(self, class_name: str, index: TreeIndex) -> bool:
+        """Check if a class defined in the indexed tree has a Protocol/ABC base."""
+        class_def = index.class_defs().get(class_name)
+        if class_def:
+            for base in class_def.bases:
+                base_name = self._get_base_name(base)
+                if base_name and self._is_protocol_or_abc(base_name, None):
+                    return True
+        return False
+
     def _find_class_def(
-        self, class_name: str, tree: ast.AST | None
+        self, class_name: str, index: TreeIndex | None
     ) -> ast.ClassDef | None:
         """Find class definition in the AST tree."""
-        if not tree:
+        if index is None:
             return None
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name == class_name:
-                return node
-
-        return None
+        return index.class_defs().get(class_name)
 
     def _has_method(self, class_node: ast.ClassDef, method_name: str) -> bool:
         """Check if class has a method with given name."""
         for node in class_node.body:
-            if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            if isinstance(node, FUNCTION_TYPES):
                 if node.name == method_name:
                     return True
         return False
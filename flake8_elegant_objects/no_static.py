@@ -1,31 +1,42 @@
 """No static methods principle checker for Elegant Objects violations."""
 
 import ast
+from typing import ClassVar
 
-from .base import ErrorCodes, Source, Violations, violation
+from .base import FUNCTION_TYPES, ErrorCodes, Source, Violations, named, violation
 
 
 class NoStatic:
     """Checks for static method violations (EO009)."""
 
+    __slots__ = ()
+
+    NODE_TYPES: ClassVar[tuple[type[ast.AST], ...]] = (
+        ast.FunctionDef,
+        ast.AsyncFunctionDef,
+    )
+    CLASS_SCOPED: ClassVar[bool] = False
+
+    STATIC_DECORATORS: ClassVar[frozenset[str]] = frozenset(
+        {"staticmethod", "classmethod"}
+    )
+
     def check(self, source: Source) -> Violations:
         """Check source for static method violations."""
         node = source.node
 
-        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-            return self._check_static_methods(node)
+        if isinstance(node, FUNCTION_TYPES):
+            return self._check_static_methods(node, source.decorator_names)
 
-        return []
+        return ()
 
     def _check_static_methods(
-        self, node: ast.FunctionDef | ast.AsyncFunctionDef
+        self,
+        node: ast.FunctionDef | ast.AsyncFunctionDef,
+        decorator_names: frozenset[str],
     ) -> Violations:
         """Check for static methods violations."""
         # Check for @staticmethod decorator
-        for decorator in node.decorator_list:
-            if isinstance(decorator, ast.Name) and decorator.id in {
-                "staticmethod",
-                "classmethod",
-            }:
-                return violation(node, ErrorCodes.EO009.format(name=node.name))
-        return []
+        if not self.STATIC_DECORATORS.isdisjoint(decorator_names):
+            return (violation(node, named(ErrorCodes.EO009, node.name)),)
+        return ()
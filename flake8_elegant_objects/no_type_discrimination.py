@@ -1,6 +1,7 @@
 """No type discrimination principle checker for Elegant Objects violations."""
 
 import ast
+from typing import ClassVar
 
 from .base import ErrorCodes, Source, Violations, violation
 
@@ -8,27 +9,35 @@ from .base import ErrorCodes, Source, Violations, violation
 class NoTypeDiscrimination:
     """Checks for type discrimination violations (EO010)."""
 
+    __slots__ = ()
+
+    NODE_TYPES: ClassVar[tuple[type[ast.AST], ...]] = (ast.Call,)
+    CLASS_SCOPED: ClassVar[bool] = False
+
+    FORBIDDEN_FUNCS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "isinstance",
+            "type",
+            "hasattr",
+            "getattr",
+            "setattr",
+            "delattr",
+            "callable",
+        }
+    )
+
     def check(self, source: Source) -> Violations:
         """Check source for type discrimination violations."""
         node = source.node
 
-        if isinstance(node, ast.Call):
+        if type(node) is ast.Call:
             return self._check_isinstance_usage(node)
 
-        return []
+        return ()
 
     def _check_isinstance_usage(self, node: ast.Call) -> Violations:
         """Check for isinstance, type casting, or reflection usage."""
         if isinstance(node.func, ast.Name):
-            forbidden_funcs = {
-                "isinstance",
-                "type",
-                "hasattr",
-                "getattr",
-                "setattr",
-                "delattr",
-                "callable",
-            }
-            if node.func.id in forbidden_funcs:
-                return violation(node, ErrorCodes.EO010)
-        return []
+            if node.func.id in self.FORBIDDEN_FUNCS:
+                return (violation(node, ErrorCodes.EO010),)
+        return ()
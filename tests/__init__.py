@@ -1 +1,11 @@
 """Tests for Elegant Objects flake8 plugin."""
+
+import ast
+from functools import cache
+
+
+@cache
+def parse(code: str) -> ast.Module:
+    """Parse code once per session; checks never mutate the trees they inspect."""
+    # Snippets are a fixed set of literals, so the cache never needs evicting
+    return ast.parse(code)
@@ -0,0 +1,52 @@
+"""Unit tests for the shared principle infrastructure."""
+
+import ast
+import sys
+
+import pytest
+
+from flake8_elegant_objects.base import (
+    ErrorCodes,
+    named,
+    principle_dispatch,
+    walk,
+)
+
+
+class TestBase:
+    """Test cases for error templates, dispatch tables and the tree walk."""
+
+    def test_error_codes_are_strings(self) -> None:
+        """Test that error templates stay plain strings for external callers."""
+        assert isinstance(ErrorCodes.EO001, str)
+        assert named(ErrorCodes.EO001, "Manager") == ErrorCodes.EO001.format(
+            name="Manager"
+        )
+
+    def test_scope_tables_share_principles(self) -> None:
+        """Test that module and class dispatch reuse the same principle instances."""
+        # Bound methods compare equal only when bound to the same instance
+        assert (
+            principle_dispatch()[ast.Constant]
+            == principle_dispatch(in_class=True)[ast.Constant]
+        )
+
+    def test_walk_matches_ast_walk(self) -> None:
+        """Test that the field-table walk visits nodes in ast.walk order."""
+        tree = ast.parse(
+            "import os\n"
+            "@dataclass(frozen=True)\n"
+            "class Point(Base, metaclass=Meta):\n"
+            "    x: int = 0\n"
+            "    async def move(self, dx: int = 1, *args, **kwargs) -> None:\n"
+            "        global counter\n"
+            "        self.x += [i for i in range(dx) if i][0]\n"
+            "        return f'{self.x!r:>10}'\n"
+        )
+        assert list(walk(tree)) == list(ast.walk(tree))
+
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason="type statement is 3.12+")
+    def test_walk_matches_ast_walk_type_alias(self) -> None:
+        """Test that a type alias name, a child node unlike most names, is walked."""
+        tree = ast.parse("type Alias = list[int]\n")
+        assert list(walk(tree)) == list(ast.walk(tree))
@@ -0,0 +1,60 @@
+"""Unit tests for the on-disk CLI results cache."""
+
+from pathlib import Path
+
+import pytest
+
+from flake8_elegant_objects import _cache
+
+
+class TestCache:
+    """Test cases for cache keys, reads and writes."""
+
+    def test_default_dir_honours_xdg(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the cache lives under XDG_CACHE_HOME when it is set."""
+        monkeypatch.setenv("XDG_CACHE_HOME", "/xdg")
+        assert _cache.default_dir() == "/xdg/flake8-elegant-objects"
+
+    def test_path_for_keyed_by_source(self, tmp_path: Path) -> None:
+        """Test that equal sources share an entry and different sources do not."""
+        first = _cache.path_for(str(tmp_path), b"x = 1\n")
+        assert first == _cache.path_for(str(tmp_path), b"x = 1\n")
+        assert first != _cache.path_for(str(tmp_path), b"x = 2\n")
+
+    def test_path_for_keyed_by_python_and_code(self, tmp_path: Path) -> None:
+        """Test that entries are kept apart per Python version and plugin code."""
+        path = _cache.path_for(str(tmp_path), b"x = 1\n")
+        relative = path.relative_to(tmp_path).parts
+        assert relative[:2] == (_cache._PYTHON_TAG, _cache.code_digest())
+
+    def test_store_then_load(self, tmp_path: Path) -> None:
+        """Test that stored violations load back unchanged."""
+        path = _cache.path_for(str(tmp_path), b"x = None\n")
+        violations = [(1, 4, "EO005 Null usage")]
+        _cache.store(path, violations)
+        assert _cache.load(path) == violations
+
+    def test_load_missing_entry(self, tmp_path: Path) -> None:
+        """Test that a missing entry is a miss."""
+        assert _cache.load(tmp_path / "missing.json") is None
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            pytest.param("{not json", id="invalid-json"),
+            pytest.param("[1, 2]", id="wrong-shape"),
+        ],
+    )
+    def test_load_corrupt_entry(self, tmp_path: Path, content: str) -> None:
+        """Test that an unreadable entry is a miss rather than an error."""
+        path = tmp_path / "entry.json"
+        path.write_text(content, encoding="utf-8")
+        assert _cache.load(path) is None
+
+    def test_store_unwritable_directory(self, tmp_path: Path) -> None:
+        """Test that failing to write an entry is silently ignored."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("", encoding="utf-8")
+        path = _cache.path_for(str(blocker), b"x = 1\n")
+        _cache.store(path, [(1, 0, "EO003 message")])
+        assert _cache.load(path) is None
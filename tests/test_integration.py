@@ -1,18 +1,36 @@
 """Integration tests for the complete flake8-elegant-objects plugin."""
 
 import ast
+from functools import cache
 
 from flake8_elegant_objects import ElegantObjectsPlugin
+from flake8_elegant_objects.base import Violation
+
+from . import parse
+
+Buckets = dict[str, tuple[Violation, ...]]
+
+
+@cache
+def _run_plugin(code: str) -> Buckets:
+    """Run the plugin over code once, bucketing violations by error code."""
+    checker = ElegantObjectsPlugin(parse(code))
+    buckets: dict[str, list[Violation]] = {}
+    for line, column, message, _ in checker.run():
+        # Named fields keep the assertions readable
+        buckets.setdefault(message.split(" ", 1)[0], []).append(
+            Violation(line, column, message)
+        )
+    # Tuples keep results shared between tests immutable
+    return {key: tuple(found) for key, found in buckets.items()}
 
 
 class TestIntegration:
     """Integration test cases for the complete plugin."""
 
-    def _check_code(self, code: str) -> list[tuple[int, int, str]]:
-        """Helper to check code and return violations."""
-        tree = ast.parse(code)
-        checker = ElegantObjectsPlugin(tree)
-        return [(line, col, msg) for line, col, msg, _ in checker.run()]
+    def _check_code(self, code: str) -> Buckets:
+        """Helper to check code and return violations keyed by error code."""
+        return _run_plugin(code)
 
     def test_comprehensive_violations(self) -> None:
         """Test detection of multiple violation types in one code sample."""
@@ -32,18 +50,19 @@ class DataManager:  # EO001 - -er class name
             return items
         return None
 """
-        violations = self._check_code(code)
-
-        # Check that we have violations from multiple principles
-        error_codes = {v[2].split()[0] for v in violations}
-
-        assert "EO001" in error_codes  # Naming
-        assert "EO005" in error_codes  # NoNull
-        assert "EO006" in error_codes  # NoConstructorCode
-        assert "EO007" in error_codes  # NoGettersSetters
-        assert "EO008" in error_codes  # NoMutableObjects
-        assert "EO009" in error_codes  # Advanced - static method
-        assert "EO010" in error_codes  # Advanced - isinstance
+        # Check that we have violations from multiple principles; one set
+        # comparison reports every missing code at once
+        error_codes = self._check_code(code).keys()
+
+        assert error_codes >= {
+            "EO001",  # Naming
+            "EO005",  # NoNull
+            "EO006",  # NoConstructorCode
+            "EO007",  # NoGettersSetters
+            "EO008",  # NoMutableObjects
+            "EO009",  # Advanced - static method
+            "EO010",  # Advanced - isinstance
+        }
 
     def test_real_world_example_violations(self) -> None:
         """Test with a more realistic code example."""
@@ -77,18 +96,12 @@ class UserManager:  # EO001 - -er class name
         violations = self._check_code(code)
 
         # Should have multiple violations
-        assert len(violations) > 5
+        assert sum(map(len, violations.values())) > 5
 
         # Check specific violation types are present
-        violation_messages = [v[2] for v in violations]
-        assert any(
-            "EO001" in msg and "UserManager" in msg for msg in violation_messages
-        )
-        assert any("EO005" in msg for msg in violation_messages)
-        assert any("EO006" in msg for msg in violation_messages)
-        assert any("EO007" in msg and "get_user" in msg for msg in violation_messages)
-        assert any("EO008" in msg for msg in violation_messages)
-        assert any("EO009" in msg for msg in violation_messages)
+        assert violations.keys() >= {"EO005", "EO006", "EO008", "EO009"}
+        assert any("UserManager" in v.message for v in violations["EO001"])
+        assert any("get_user" in v.message for v in violations["EO007"])
 
     def test_clean_elegant_code(self) -> None:
         """Test that clean, elegant code has no violations."""
@@ -119,8 +132,7 @@ class UserRepository:
 
         # Clean code should have minimal or no violations
         # Filter out any false positives for method contracts (EO011)
-        serious_violations = [v for v in violations if not v[2].startswith("EO011")]
-        assert len(serious_violations) == 0
+        assert violations.keys() <= {"EO011"}
 
     def test_mixed_valid_invalid_code(self) -> None:
         """Test code with both valid and invalid patterns."""
@@ -142,16 +154,10 @@ class DataProcessor:  # EO001 - -er name
 """
         violations = self._check_code(code)
 
-        # Should have exactly the violations from invalid patterns
-        violation_messages = [v[2] for v in violations]
-
         # Check invalid patterns are caught
-        assert any(
-            "EO001" in msg and "DataProcessor" in msg for msg in violation_messages
-        )
-        assert any("EO005" in msg for msg in violation_messages)
-        assert any("EO007" in msg and "get_name" in msg for msg in violation_messages)
-        assert any("EO008" in msg for msg in violation_messages)
+        assert violations.keys() >= {"EO005", "EO008"}
+        assert any("DataProcessor" in v.message for v in violations["EO001"])
+        assert any("get_name" in v.message for v in violations["EO007"])
 
     def test_plugin_end_to_end(self) -> None:
         """Test complete plugin functionality end-to-end."""
@@ -223,10 +229,7 @@ user.save()
 class DataContainer(list):
     pass
 """
-        violations = self._check_code(code)
-
-        # Extract error codes
-        error_codes = {v[2].split()[0] for v in violations}
+        error_codes = self._check_code(code).keys()
 
         # Should have most error codes (some might not trigger in this specific example)
         expected_codes = {
@@ -242,7 +245,49 @@ class DataContainer(list):
             "EO013",
             "EO014",
         }
-        found_codes = error_codes.intersection(expected_codes)
+        found_codes = error_codes & expected_codes
 
         # Should find at least most of the expected codes
         assert len(found_codes) >= 8
+
+    def test_deeply_nested_tree(self) -> None:
+        """Test that traversal does not recurse per AST level."""
+        expression: ast.expr = ast.Constant(value=None, lineno=1, col_offset=0)
+        for _ in range(5000):
+            expression = ast.UnaryOp(
+                op=ast.Not(), operand=expression, lineno=1, col_offset=0
+            )
+        tree = ast.Module(body=[ast.Expr(value=expression)], type_ignores=[])
+        violations = list(ElegantObjectsPlugin(tree).run())
+        assert [v[2].split()[0] for v in violations] == ["EO005"]
+
+    def test_class_scoped_checks_skip_module_level(self) -> None:
+        """Test that class-only principles report in classes but not outside."""
+        code = """
+class Account:
+    def balance(self) -> int:
+        return 1
+
+def total(self) -> int:
+    return 1
+"""
+        violations = self._check_code(code)
+        assert [v.line for v in violations["EO011"]] == [3]
+
+    def test_principles_hold_no_state(self) -> None:
+        """Test that shared principles report each tree's violations only."""
+        first = "class Service(Base):\n    def run(self) -> None:\n        pass\n"
+        second = "\n\nclass Point:\n    def move(self) -> None:\n        pass\n"
+
+        def run(code: str) -> list[tuple[int, str]]:
+            # A fresh tree per run, so no result is served from the parse cache
+            checker = ElegantObjectsPlugin(ast.parse(code))
+            return [(line, message) for line, _, message, _ in checker.run()]
+
+        before = run(first)
+        other = run(second)
+        assert run(first) == before
+        assert {line for line, _ in before} == {1, 2}
+        assert {line for line, _ in other} == {4}
+        assert not any("Point" in message for _, message in before)
+        assert not any("Service" in message for _, message in other)
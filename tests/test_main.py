@@ -0,0 +1,69 @@
+"""Unit tests for the standalone command-line interface."""
+
+from pathlib import Path
+
+import pytest
+
+from flake8_elegant_objects.__main__ import _lint_file
+
+
+class TestLintFile:
+    """Test cases for checking a single file from the command line."""
+
+    def _lint(
+        self,
+        tmp_path: Path,
+        source: str,
+        show_source: bool = False,
+        encoding: str = "utf-8",
+    ) -> tuple[list[str], str, int]:
+        """Helper to write source to a file and lint it without the cache."""
+        path = tmp_path / "module.py"
+        path.write_text(source, encoding=encoding)
+        return _lint_file(str(path), show_source, None)
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            pytest.param("", id="empty"),
+            pytest.param("\n   \n", id="whitespace"),
+            pytest.param("#!/usr/bin/env python\n  # nothing here\n", id="comments"),
+        ],
+    )
+    def test_blank_file_clean(self, tmp_path: Path, source: str) -> None:
+        """Test that files without code are reported clean."""
+        output, error, count = self._lint(tmp_path, source)
+        assert error == ""
+        assert count == 0
+        assert output[0].endswith("No violations found ✓")
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            pytest.param("x +\n", id="incomplete-expression"),
+            pytest.param("import\n", id="bare-import"),
+        ],
+    )
+    def test_syntax_error_reported(self, tmp_path: Path, source: str) -> None:
+        """Test that unparsable files are reported as errors, not as clean."""
+        output, error, count = self._lint(tmp_path, source)
+        assert error.startswith("Error processing")
+        assert count == 0
+        assert output == []
+
+    def test_violations_reported(self, tmp_path: Path) -> None:
+        """Test that violations are reported with their location."""
+        output, error, count = self._lint(tmp_path, "value = None\n")
+        assert error == ""
+        assert count == 1
+        assert ":1:8: EO005" in output[0]
+
+    def test_show_source_honours_coding_cookie(self, tmp_path: Path) -> None:
+        """Test that source context is decoded with the file's declared encoding."""
+        source = "# -*- coding: latin-1 -*-\nclass CaféManager:\n    pass\n"
+        output, error, count = self._lint(
+            tmp_path, source, show_source=True, encoding="latin-1"
+        )
+        assert error == ""
+        assert count == 1
+        assert output[1] == "    class CaféManager:"
@@ -2,18 +2,20 @@
 
 import ast
 
-from flake8_elegant_objects.base import Source
+from flake8_elegant_objects.base import Source, Violation
 from flake8_elegant_objects.no_constructor_code import NoConstructorCode
 
+from . import parse
+
 
 class TestNoConstructorCodePrinciple:
     """Test cases for constructor code violations detection."""
 
     def _check_code(self, code: str) -> list[str]:
         """Helper to check code and return violation messages."""
-        tree = ast.parse(code)
+        tree = parse(code)
         checker = NoConstructorCode()
-        violations = []
+        violations: list[Violation] = []
 
         def visit(node: ast.AST) -> None:
             source = Source(node, None, tree)
@@ -35,7 +37,7 @@ class User:
 """
         violations = self._check_code(code)
         assert len(violations) == 2
-        assert all("EO006" in v for v in violations)
+        assert all(v.startswith("EO006") for v in violations)
 
     def test_constructor_with_computation_violation(self) -> None:
         """Test detection of computation in constructor assignments."""
@@ -48,7 +50,7 @@ class Calculator:
 """
         violations = self._check_code(code)
         assert len(violations) == 2
-        assert all("EO006" in v for v in violations)
+        assert all(v.startswith("EO006") for v in violations)
 
     def test_constructor_with_method_calls_violation(self) -> None:
         """Test detection of method calls in constructors."""
@@ -61,7 +63,7 @@ class Logger:
 """
         violations = self._check_code(code)
         assert len(violations) == 2
-        assert all("EO006" in v for v in violations)
+        assert all(v.startswith("EO006") for v in violations)
 
     def test_valid_constructor_simple_assignments(self) -> None:
         """Test that simple parameter assignments don't trigger violations."""
@@ -116,7 +118,7 @@ class Factory:
 """
         violations = self._check_code(code)
         # This should not trigger constructor code violation since it's static
-        constructor_violations = [v for v in violations if "EO006" in v]
+        constructor_violations = [v for v in violations if v.startswith("EO006")]
         assert len(constructor_violations) == 0
 
     def test_constructor_with_complex_assignment_violation(self) -> None:
@@ -130,4 +132,4 @@ class DataContainer:
 """
         violations = self._check_code(code)
         assert len(violations) == 2
-        assert all("EO006" in v for v in violations)
+        assert all(v.startswith("EO006") for v in violations)
@@ -2,8 +2,10 @@
 
 import ast
 
-from flake8_elegant_objects.base import Source
-from flake8_elegant_objects.no_er_name import NoErName
+from flake8_elegant_objects.base import Source, Violation
+from flake8_elegant_objects.no_er_name import NoErName, SuffixTrie
+
+from . import parse
 
 
 class TestNamingPrinciple:
@@ -11,9 +13,9 @@ class TestNamingPrinciple:
 
     def _check_code(self, code: str) -> list[str]:
         """Helper to check code and return violation messages."""
-        tree = ast.parse(code)
+        tree = parse(code)
         checker = NoErName()
-        violations = []
+        violations: list[Violation] = []
 
         def visit(node: ast.AST, current_class: ast.ClassDef | None = None) -> None:
             if isinstance(node, ast.ClassDef):
@@ -40,9 +42,9 @@ class Helper:
 """
         violations = self._check_code(code)
         assert len(violations) == 3
-        assert any("Manager" in v and "EO001" in v for v in violations)
-        assert any("Controller" in v and "EO001" in v for v in violations)
-        assert any("Helper" in v and "EO001" in v for v in violations)
+        assert any("Manager" in v and v.startswith("EO001") for v in violations)
+        assert any("Controller" in v and v.startswith("EO001") for v in violations)
+        assert any("Helper" in v and v.startswith("EO001") for v in violations)
 
     def test_procedural_function_name_violation(self) -> None:
         """Test detection of procedural function names."""
@@ -58,9 +60,11 @@ def handle_request():
 """
         violations = self._check_code(code)
         assert len(violations) == 3
-        assert any("analyze_data" in v and "EO004" in v for v in violations)
-        assert any("process_information" in v and "EO004" in v for v in violations)
-        assert any("handle_request" in v and "EO004" in v for v in violations)
+        assert any("analyze_data" in v and v.startswith("EO004") for v in violations)
+        assert any(
+            "process_information" in v and v.startswith("EO004") for v in violations
+        )
+        assert any("handle_request" in v and v.startswith("EO004") for v in violations)
 
     def test_procedural_method_name_violation(self) -> None:
         """Test detection of procedural method names."""
@@ -76,7 +80,7 @@ class DataHandler:
         pass
 """
         violations = self._check_code(code)
-        method_violations = [v for v in violations if "EO002" in v]
+        method_violations = [v for v in violations if v.startswith("EO002")]
         assert len(method_violations) == 3
         assert any("process_data" in v for v in method_violations)
         assert any("analyze_results" in v for v in method_violations)
@@ -91,9 +95,9 @@ handler = RequestHandler()
 """
         violations = self._check_code(code)
         assert len(violations) == 3
-        assert any("manager" in v and "EO003" in v for v in violations)
-        assert any("processor" in v and "EO003" in v for v in violations)
-        assert any("handler" in v and "EO003" in v for v in violations)
+        assert any("manager" in v and v.startswith("EO003") for v in violations)
+        assert any("processor" in v and v.startswith("EO003") for v in violations)
+        assert any("handler" in v and v.startswith("EO003") for v in violations)
 
     def test_allowed_exceptions(self) -> None:
         """Test that allowed exceptions don't trigger violations."""
@@ -133,9 +137,9 @@ class RequestHandler:
 """
         violations = self._check_code(code)
         assert len(violations) == 3
-        assert any("UserManager" in v and "EO001" in v for v in violations)
-        assert any("DataProcessor" in v and "EO001" in v for v in violations)
-        assert any("RequestHandler" in v and "EO001" in v for v in violations)
+        assert any("UserManager" in v and v.startswith("EO001") for v in violations)
+        assert any("DataProcessor" in v and v.startswith("EO001") for v in violations)
+        assert any("RequestHandler" in v and v.startswith("EO001") for v in violations)
 
     def test_camel_case_procedural_names(self) -> None:
         """Test detection of camelCase procedural names."""
@@ -152,6 +156,27 @@ class DataProcessor:
 """
         violations = self._check_code(code)
         assert len(violations) >= 3
-        assert any("analyzeData" in v and "EO004" in v for v in violations)
-        assert any("processInformation" in v and "EO004" in v for v in violations)
-        assert any("handleRequest" in v and "EO002" in v for v in violations)
+        assert any("analyzeData" in v and v.startswith("EO004") for v in violations)
+        assert any(
+            "processInformation" in v and v.startswith("EO004") for v in violations
+        )
+        assert any("handleRequest" in v and v.startswith("EO002") for v in violations)
+
+
+class TestSuffixTrie:
+    """Test cases for reversed-suffix trie matching."""
+
+    def test_matches_any_suffix(self) -> None:
+        """Test that names ending with a known suffix match."""
+        trie = SuffixTrie(NoErName.ER_SUFFIXES)
+        assert all(
+            trie.matches(name)
+            for name in ("manager", "datamanager", "requesthandler", "filter")
+        )
+
+    def test_ignores_suffix_in_the_middle(self) -> None:
+        """Test that a suffix elsewhere in the name does not match."""
+        trie = SuffixTrie(NoErName.ER_SUFFIXES)
+        assert not any(
+            trie.matches(name) for name in ("managerstate", "handlers", "er", "")
+        )
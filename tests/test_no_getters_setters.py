@@ -2,18 +2,20 @@
 
 import ast
 
-from flake8_elegant_objects.base import Source
+from flake8_elegant_objects.base import Source, Violation
 from flake8_elegant_objects.no_getters_setters import NoGettersSetters
 
+from . import parse
+
 
 class TestNoGettersSettersPrinciple:
     """Test cases for getter/setter violations detection."""
 
     def _check_code(self, code: str) -> list[str]:
         """Helper to check code and return violation messages."""
-        tree = ast.parse(code)
+        tree = parse(code)
         checker = NoGettersSetters()
-        violations = []
+        violations: list[Violation] = []
 
         def visit(node: ast.AST, current_class: ast.ClassDef | None = None) -> None:
             if isinstance(node, ast.ClassDef):
@@ -44,7 +46,7 @@ class User:
 """
         violations = self._check_code(code)
         assert len(violations) == 4
-        assert all("EO007" in v for v in violations)
+        assert all(v.startswith("EO007") for v in violations)
         assert any("get_name" in v for v in violations)
         assert any("set_name" in v for v in violations)
         assert any("getName" in v for v in violations)
@@ -62,7 +64,7 @@ class Data:
 """
         violations = self._check_code(code)
         assert len(violations) == 2
-        assert all("EO007" in v for v in violations)
+        assert all(v.startswith("EO007") for v in violations)
         assert any("get" in v for v in violations)
         assert any("set" in v for v in violations)
 
@@ -84,7 +86,18 @@ class Person:
 """
         violations = self._check_code(code)
         assert len(violations) == 4
-        assert all("EO007" in v for v in violations)
+        assert all(v.startswith("EO007") for v in violations)
+
+    def test_non_ascii_camel_case_violation(self) -> None:
+        """Test detection of camelCase getters with a non-ASCII capital."""
+        code = """
+class Basket:
+    def getÄpfel(self):
+        return self.apples
+"""
+        violations = self._check_code(code)
+        assert len(violations) == 1
+        assert violations[0].startswith("EO007")
 
     def test_private_methods_ignored(self) -> None:
         """Test that private methods starting with _ are ignored."""
@@ -124,7 +137,21 @@ class User:
         violations = self._check_code(code)
         # Note: update_profile, process_data, calculate_total might trigger
         # other violations (naming) but not getter/setter violations
-        getter_setter_violations = [v for v in violations if "EO007" in v]
+        getter_setter_violations = [v for v in violations if v.startswith("EO007")]
+        assert len(getter_setter_violations) == 0
+
+    def test_get_set_prefixed_words_valid(self) -> None:
+        """Test that words merely starting with get/set are not getters/setters."""
+        code = """
+class Document:
+    def settings(self):
+        return self._settings
+
+    def gettext(self):
+        return self._text
+"""
+        violations = self._check_code(code)
+        getter_setter_violations = [v for v in violations if v.startswith("EO007")]
         assert len(getter_setter_violations) == 0
 
     def test_property_decorators_ignored(self) -> None:
@@ -140,7 +167,7 @@ class User:
         return self._name
 """
         violations = self._check_code(code)
-        getter_setter_violations = [v for v in violations if "EO007" in v]
+        getter_setter_violations = [v for v in violations if v.startswith("EO007")]
         assert len(getter_setter_violations) == 0
 
     def test_functions_not_methods_ignored(self) -> None:
@@ -157,7 +184,7 @@ def getDataFromAPI():
 """
         violations = self._check_code(code)
         # These might trigger naming violations but not getter/setter violations
-        getter_setter_violations = [v for v in violations if "EO007" in v]
+        getter_setter_violations = [v for v in violations if v.startswith("EO007")]
         assert len(getter_setter_violations) == 0
 
     def test_mixed_valid_invalid_methods(self) -> None:
@@ -180,7 +207,7 @@ class DataProcessor:
         return self._internal
 """
         violations = self._check_code(code)
-        getter_setter_violations = [v for v in violations if "EO007" in v]
+        getter_setter_violations = [v for v in violations if v.startswith("EO007")]
         assert len(getter_setter_violations) == 2
         assert any("get_data" in v for v in getter_setter_violations)
         assert any("set_config" in v for v in getter_setter_violations)
@@ -2,20 +2,22 @@
 
 import ast
 
-from flake8_elegant_objects.base import Source
+from flake8_elegant_objects.base import Source, Violation
 from flake8_elegant_objects.no_implementation_inheritance import (
     NoImplementationInheritance,
 )
 
+from . import parse
+
 
 class TestNoImplementationInheritance:
     """Test cases for implementation inheritance violations detection."""
 
     def _check_code(self, code: str) -> list[str]:
         """Helper to check code and return violation messages."""
-        tree = ast.parse(code)
+        tree = parse(code)
         checker = NoImplementationInheritance()
-        violations = []
+        violations: list[Violation] = []
 
         def visit(node: ast.AST, current_class: ast.ClassDef | None = None) -> None:
             if isinstance(node, ast.ClassDef):
@@ -40,7 +42,7 @@ class Child(ConcreteBase):
 """
         violations = self._check_code(code)
         assert len(violations) == 1
-        assert "EO014" in violations[0]
+        assert violations[0].startswith("EO014")
 
     def test_valid_abstract_inheritance(self) -> None:
         """Test that abstract inheritance is allowed."""
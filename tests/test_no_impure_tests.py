@@ -2,18 +2,20 @@
 
 import ast
 
-from flake8_elegant_objects.base import Source
+from flake8_elegant_objects.base import Source, Violation
 from flake8_elegant_objects.no_impure_tests import NoImpureTests
 
+from . import parse
+
 
 class TestNoImpureTests:
     """Test cases for impure test method violations detection."""
 
     def _check_code(self, code: str) -> list[str]:
         """Helper to check code and return violation messages."""
-        tree = ast.parse(code)
+        tree = parse(code)
         checker = NoImpureTests()
-        violations = []
+        violations: list[Violation] = []
 
         def visit(node: ast.AST, current_class: ast.ClassDef | None = None) -> None:
             if isinstance(node, ast.ClassDef):
@@ -151,3 +153,12 @@ def test_assertThat_example(self):
 """
         violations = self._check_code(code)
         assert len(violations) == 0
+
+    def test_non_assertion_chain_invalid(self) -> None:
+        """Test that chained calls rooted in a plain function are not assertions."""
+        code = """
+def test_builder_example(self):
+    build(5).verify(8)
+"""
+        violations = self._check_code(code)
+        assert len(violations) == 2
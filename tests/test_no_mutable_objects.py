@@ -2,18 +2,20 @@
 
 import ast
 
-from flake8_elegant_objects.base import Source
+from flake8_elegant_objects.base import Source, Violation
 from flake8_elegant_objects.no_mutable_objects import NoMutableObjects
 
+from . import parse
+
 
 class TestNoMutableObjectsPrinciple:
     """Test cases for mutable objects violations detection."""
 
     def _check_code(self, code: str) -> list[str]:
         """Helper to check code and return violation messages."""
-        tree = ast.parse(code)
+        tree = parse(code)
         checker = NoMutableObjects()
-        violations = []
+        violations: list[Violation] = []
 
         def visit(node: ast.AST, current_class: ast.ClassDef | None = None) -> None:
             if isinstance(node, ast.ClassDef):
@@ -42,7 +44,7 @@ class AnotherMutable:
 """
         violations = self._check_code(code)
         assert len(violations) == 2
-        assert all("EO008" in v for v in violations)
+        assert all(v.startswith("EO008") for v in violations)
         assert any("MutableUser" in v for v in violations)
         assert any("AnotherMutable" in v for v in violations)
 
@@ -63,6 +65,19 @@ class ImmutableData:
         violations = self._check_code(code)
         assert len(violations) == 0
 
+    def test_frozen_dataclass_mutable_class_attribute(self) -> None:
+        """Test that frozen=True does not hide a shared mutable class attribute."""
+        code = """
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class Registry:
+    defaults = {}
+"""
+        violations = self._check_code(code)
+        assert len(violations) == 1
+        assert "defaults" in violations[0]
+
     def test_mutable_class_attributes_violation(self) -> None:
         """Test detection of mutable class attributes."""
         code = """
@@ -76,7 +91,7 @@ class ProcessorConfig:
 """
         violations = self._check_code(code)
         assert len(violations) == 4
-        assert all("EO008" in v for v in violations)
+        assert all(v.startswith("EO008") for v in violations)
 
     def test_mutable_type_constructors_violation(self) -> None:
         """Test detection of mutable type constructors as class attributes."""
@@ -93,7 +108,7 @@ class ValidConfig:
 """
         violations = self._check_code(code)
         assert len(violations) == 4
-        assert all("EO008" in v for v in violations)
+        assert all(v.startswith("EO008") for v in violations)
 
     def test_immutable_class_attributes_valid(self) -> None:
         """Test that immutable class attributes don't trigger violations."""
@@ -129,7 +144,7 @@ class UnsafeHash:
     data: str
 """
         violations = self._check_code(code)
-        mutable_violations = [v for v in violations if "EO008" in v]
+        mutable_violations = [v for v in violations if v.startswith("EO008")]
         assert len(mutable_violations) == 2
         assert any("ExplicitlyMutable" in v for v in mutable_violations)
         assert any("UnsafeHash" in v for v in mutable_violations)
@@ -148,7 +163,7 @@ class AnotherRegular:
         # Should only have 1 violation for the mutable class attribute
         assert len(violations) == 1
         assert "data" in violations[0]
-        assert "EO008" in violations[0]
+        assert violations[0].startswith("EO008")
 
     def test_instance_attributes_ignored(self) -> None:
         """Test that instance attributes in methods are ignored."""
@@ -163,5 +178,5 @@ class DataProcessor:
 """
         violations = self._check_code(code)
         # Instance attributes should not trigger this violation
-        mutable_violations = [v for v in violations if "EO008" in v]
+        mutable_violations = [v for v in violations if v.startswith("EO008")]
         assert len(mutable_violations) == 0
@@ -2,18 +2,20 @@
 
 import ast
 
-from flake8_elegant_objects.base import Source
+from flake8_elegant_objects.base import Source, Violation
 from flake8_elegant_objects.no_null import NoNull
 
+from . import parse
+
 
 class TestNoNullPrinciple:
     """Test cases for None usage violations detection."""
 
     def _check_code(self, code: str) -> list[str]:
         """Helper to check code and return violation messages."""
-        tree = ast.parse(code)
+        tree = parse(code)
         checker = NoNull()
-        violations = []
+        violations: list[Violation] = []
 
         def visit(node: ast.AST) -> None:
             source = Source(node, None, tree)
@@ -36,7 +38,7 @@ result = None if condition else data
 """
         violations = self._check_code(code)
         assert len(violations) == 3
-        assert all("EO005" in v for v in violations)
+        assert all(v.startswith("EO005") for v in violations)
         assert all("None" in v for v in violations)
 
     def test_none_in_function_arguments(self) -> None:
@@ -50,7 +52,7 @@ def handle_request(request, user=None):
 """
         violations = self._check_code(code)
         assert len(violations) == 2
-        assert all("EO005" in v for v in violations)
+        assert all(v.startswith("EO005") for v in violations)
 
     def test_none_in_class_attributes(self) -> None:
         """Test detection of None in class attributes."""
@@ -64,7 +66,7 @@ class User:
 """
         violations = self._check_code(code)
         assert len(violations) == 3
-        assert all("EO005" in v for v in violations)
+        assert all(v.startswith("EO005") for v in violations)
 
     def test_none_in_comparison(self) -> None:
         """Test detection of None in comparisons."""
@@ -79,7 +81,7 @@ result = value is not None
 """
         violations = self._check_code(code)
         assert len(violations) == 3
-        assert all("EO005" in v for v in violations)
+        assert all(v.startswith("EO005") for v in violations)
 
     def test_none_in_list_comprehension(self) -> None:
         """Test detection of None in list comprehensions."""
@@ -89,7 +91,7 @@ filtered = [x for x in data if x is not None]
 """
         violations = self._check_code(code)
         assert len(violations) == 2
-        assert all("EO005" in v for v in violations)
+        assert all(v.startswith("EO005") for v in violations)
 
     def test_valid_code_without_none(self) -> None:
         """Test that code without None doesn't trigger violations."""
@@ -124,3 +126,16 @@ def process(data: str | None = "") -> None:
         # Type annotations with None should not trigger violations
         # Only actual None values should
         assert len(violations) == 0
+
+    def test_checker_reused_across_trees(self) -> None:
+        """Test that annotation contexts are recomputed for each new tree."""
+        checker = NoNull()
+        annotated = ast.parse("def run() -> None:\n    pass\n")
+        plain = ast.parse("value = None\n")
+        messages = [
+            v.message
+            for tree in (annotated, plain)
+            for node in ast.walk(tree)
+            for v in checker.check(Source(node, None, tree))
+        ]
+        assert len(messages) == 1
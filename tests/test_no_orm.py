@@ -2,18 +2,22 @@
 
 import ast
 
-from flake8_elegant_objects.base import Source
+import pytest
+
+from flake8_elegant_objects.base import Source, Violation
 from flake8_elegant_objects.no_orm import NoOrm
 
+from . import parse
+
 
 class TestNoOrm:
     """Test cases for ORM pattern violations detection."""
 
     def _check_code(self, code: str) -> list[str]:
         """Helper to check code and return violation messages."""
-        tree = ast.parse(code)
+        tree = parse(code)
         checker = NoOrm()
-        violations = []
+        violations: list[Violation] = []
 
         def visit(node: ast.AST, current_class: ast.ClassDef | None = None) -> None:
             if isinstance(node, ast.ClassDef):
@@ -26,24 +30,18 @@ class TestNoOrm:
         visit(tree)
         return [v.message for v in violations]
 
-    def test_orm_save_violation(self) -> None:
-        """Test detection of ORM save pattern."""
-        code = """
-user = User()
-user.save()
-"""
-        violations = self._check_code(code)
-        assert len(violations) == 1
-        assert "EO013" in violations[0]
-
-    def test_orm_query_violation(self) -> None:
-        """Test detection of ORM query pattern."""
-        code = """
-users = User.objects.filter(name="John")
-"""
+    @pytest.mark.parametrize(
+        "code",
+        [
+            pytest.param("user = User()\nuser.save()\n", id="save"),
+            pytest.param('users = User.objects.filter(name="John")\n', id="query"),
+        ],
+    )
+    def test_orm_violation(self, code: str) -> None:
+        """Test detection of ORM save and query patterns."""
         violations = self._check_code(code)
         assert len(violations) == 1
-        assert "EO013" in violations[0]
+        assert violations[0].startswith("EO013")
 
     def test_built_in_methods_valid(self) -> None:
         """Test that built-in methods are valid."""
@@ -2,20 +2,22 @@
 
 import ast
 
-from flake8_elegant_objects.base import Source
+from flake8_elegant_objects.base import Source, Violation
 from flake8_elegant_objects.no_public_methods_without_contracts import (
     NoPublicMethodsWithoutContracts,
 )
 
+from . import parse
+
 
 class TestNoPublicMethodsWithoutContracts:
     """Test cases for public methods without contracts violations detection."""
 
     def _check_code(self, code: str) -> list[str]:
         """Helper to check code and return violation messages."""
-        tree = ast.parse(code)
+        tree = parse(code)
         checker = NoPublicMethodsWithoutContracts()
-        violations = []
+        violations: list[Violation] = []
 
         def visit(node: ast.AST, current_class: ast.ClassDef | None = None) -> None:
             if isinstance(node, ast.ClassDef):
@@ -37,7 +39,7 @@ class Service:
 """
         violations = self._check_code(code)
         assert len(violations) == 1
-        assert "EO011" in violations[0]
+        assert violations[0].startswith("EO011")
 
     def test_private_method_valid(self) -> None:
         """Test that private methods are valid."""
@@ -132,7 +134,7 @@ class DiskFile:
 """
         violations = self._check_code(code)
         assert len(violations) == 2
-        assert all("EO011" in v for v in violations)
+        assert all(v.startswith("EO011") for v in violations)
         assert any("read" in v for v in violations)
         assert any("write" in v for v in violations)
 
@@ -163,7 +165,7 @@ class PartiallyGoodStorage(StorageABC):
         violations = self._check_code(code)
         assert len(violations) == 1
         assert "delete" in violations[0]
-        assert "EO011" in violations[0]
+        assert violations[0].startswith("EO011")
 
     def test_special_methods_valid(self) -> None:
         """Test that special methods (dunder methods) are valid."""
@@ -263,7 +265,7 @@ class BadMemoryStorage:
 """
         violations = self._check_code(code)
         assert len(violations) == 2
-        assert all("EO011" in v for v in violations)
+        assert all(v.startswith("EO011") for v in violations)
         assert any("save" in v for v in violations)
         assert any("load" in v for v in violations)
 
@@ -275,3 +277,24 @@ class EmptyClass:
 """
         violations = self._check_code(code)
         assert len(violations) == 0
+
+    def test_checker_reused_across_trees(self) -> None:
+        """Test that class contracts are recomputed for each new tree."""
+        checker = NoPublicMethodsWithoutContracts()
+        contract = ast.parse(
+            "class Shape(Protocol):\n    def area(self): ...\n"
+            "class Square(Shape):\n    def area(self):\n        return 1\n"
+        )
+        plain = ast.parse(
+            "class Shape:\n    pass\n"
+            "class Square(Shape):\n    def area(self):\n        return 1\n"
+        )
+        messages: list[str] = []
+        for tree in (contract, plain):
+            square = tree.body[1]
+            assert isinstance(square, ast.ClassDef)
+            method = square.body[0]
+            messages.extend(
+                v.message for v in checker.check(Source(method, square, tree))
+            )
+        assert len(messages) == 1
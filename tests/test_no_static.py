@@ -2,18 +2,20 @@
 
 import ast
 
-from flake8_elegant_objects.base import Source
+from flake8_elegant_objects.base import Source, Violation
 from flake8_elegant_objects.no_static import NoStatic
 
+from . import parse
+
 
 class TestNoStatic:
     """Test cases for static method violations detection."""
 
     def _check_code(self, code: str) -> list[str]:
         """Helper to check code and return violation messages."""
-        tree = ast.parse(code)
+        tree = parse(code)
         checker = NoStatic()
-        violations = []
+        violations: list[Violation] = []
 
         def visit(node: ast.AST, current_class: ast.ClassDef | None = None) -> None:
             if isinstance(node, ast.ClassDef):
@@ -39,7 +41,7 @@ class Test:
         pass
 """
         violations = self._check_code(code)
-        static_violations = [v for v in violations if "EO009" in v]
+        static_violations = [v for v in violations if v.startswith("EO009")]
         assert len(static_violations) == 2
 
     def test_regular_methods_valid(self) -> None:
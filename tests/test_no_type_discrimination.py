@@ -2,18 +2,22 @@
 
 import ast
 
-from flake8_elegant_objects.base import Source
+import pytest
+
+from flake8_elegant_objects.base import Source, Violation
 from flake8_elegant_objects.no_type_discrimination import NoTypeDiscrimination
 
+from . import parse
+
 
 class TestNoTypeDiscrimination:
     """Test cases for type discrimination violations detection."""
 
     def _check_code(self, code: str) -> list[str]:
         """Helper to check code and return violation messages."""
-        tree = ast.parse(code)
+        tree = parse(code)
         checker = NoTypeDiscrimination()
-        violations = []
+        violations: list[Violation] = []
 
         def visit(node: ast.AST, current_class: ast.ClassDef | None = None) -> None:
             if isinstance(node, ast.ClassDef):
@@ -26,36 +30,27 @@ class TestNoTypeDiscrimination:
         visit(tree)
         return [v.message for v in violations]
 
-    def test_isinstance_violation(self) -> None:
-        """Test detection of isinstance usage."""
-        code = """
-def check_data(data):
-    if isinstance(data, str):
-        return True
-"""
-        violations = self._check_code(code)
-        assert len(violations) == 1
-        assert "EO010" in violations[0]
-
-    def test_reflection_violation(self) -> None:
-        """Test detection of reflection usage."""
-        code = """
-def inspect_object(obj):
-    return hasattr(obj, 'attribute')
-"""
-        violations = self._check_code(code)
-        assert len(violations) == 1
-        assert "EO010" in violations[0]
-
-    def test_type_function_violation(self) -> None:
-        """Test detection of type() function usage."""
-        code = """
-def get_type(obj):
-    return type(obj)
-"""
+    @pytest.mark.parametrize(
+        "code",
+        [
+            pytest.param(
+                "def check_data(data):\n"
+                "    if isinstance(data, str):\n"
+                "        return True\n",
+                id="isinstance",
+            ),
+            pytest.param(
+                "def inspect_object(obj):\n    return hasattr(obj, 'attribute')\n",
+                id="reflection",
+            ),
+            pytest.param("def get_type(obj):\n    return type(obj)\n", id="type"),
+        ],
+    )
+    def test_type_discrimination_violation(self, code: str) -> None:
+        """Test detection of isinstance, reflection and type() usage."""
         violations = self._check_code(code)
         assert len(violations) == 1
-        assert "EO010" in violations[0]
+        assert violations[0].startswith("EO010")
 
     def test_valid_code(self) -> None:
         """Test that code without type discrimination is valid."""